@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""Objects allocated by the story call.
+
+Count objects tracked by the garbage collector which are left after the
+story call with automatic collection disabled.  These are reference
+cycles only the cyclic garbage collector could reclaim.  Peak memory
+allocated during the call is measured with `tracemalloc`.
+
+Run it with `python benchmarks/context.py`.
+"""
+import gc
+import sys
+import tracemalloc
+
+from stories import arguments
+from stories import story
+from stories import Success
+
+
+class Action(object):
+    @story
+    @arguments("foo", "bar")
+    def x(I):
+        I.one
+        I.two
+
+    def one(self, ctx):
+        ctx.baz = ctx.foo + ctx.bar
+        return Success()
+
+    def two(self, ctx):
+        return Success()
+
+
+def main(calls=1000):
+    x = Action().x
+    x(foo=1, bar=2)
+
+    gc.collect()
+    gc.disable()
+    try:
+        before = len(gc.get_objects())
+        for _call in range(calls):
+            x(foo=1, bar=2)
+        after = len(gc.get_objects())
+    finally:
+        gc.enable()
+
+    tracemalloc.start()
+    first, _peak = tracemalloc.get_traced_memory()
+    x(foo=1, bar=2)
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    sys.stdout.write(
+        "cyclic garbage: {:.1f} objects per call\n".format((after - before) / calls)
+    )
+    sys.stdout.write("allocated: {} bytes peak per call\n".format(peak - first))
+
+
+if __name__ == "__main__":
+    main()
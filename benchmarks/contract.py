@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""Story call validated by the context contract.
+
+Compare validation of all story arguments at once with validation of
+each argument on its own.  Example stories are taken from the test
+suite.
+
+Run it with `python benchmarks/contract.py`.
+"""
+import os
+import sys
+from importlib import import_module
+from timeit import repeat
+
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(root, "tests", "helpers"))
+
+
+def examples():
+    kwargs = {"foo": {"key": "1"}, "bar": {"key": "2"}, "baz": {"key": 3}}
+    for library in ["marshmallow3", "cerberus", "pydantic", "msgspec"]:
+        yield library, "ParamChildAlias", kwargs
+
+
+def make_wide_pydantic(arguments):
+    """Story with many integer arguments in the pydantic contract."""
+    from pydantic import create_model
+    from stories import arguments as define_arguments
+    from stories import story
+
+    names = ["arg%d" % i for i in range(arguments)]
+
+    def x(I):
+        I.one
+
+    x = story(define_arguments(*names)(x))
+    x.contract(create_model("Contract", **{name: (int, ...) for name in names}))
+    return type("Wide", (object,), {"x": x}), dict.fromkeys(names, "1")
+
+
+def measure(story, kwargs):
+    def call():
+        story(**kwargs)
+
+    call()
+    return min(repeat(call, number=2000, repeat=5)) / 2000
+
+
+def main():
+    for library, name, kwargs in examples():
+        try:
+            m = import_module("examples.contract." + library + ".functions")
+        except ImportError:
+            continue
+        story = type("T", (getattr(m, name), m.NormalMethod), {})().x
+        batched = measure(story, kwargs)
+        unbatch(story)
+        separate = measure(story, kwargs)
+        report(library, batched, separate)
+
+    try:
+        m = import_module("examples.contract.pydantic.functions")
+    except ImportError:
+        return
+    cls, kwargs = make_wide_pydantic(15)
+    story = type("T", (cls, m.NormalMethod), {})().x
+    batched = measure(story, kwargs)
+    unbatch(story)
+    separate = measure(story, kwargs)
+    report("pydantic (15)", batched, separate)
+
+
+def unbatch(story):
+    for _method, contract, _protocol in story.methods:
+        contract.batches, contract.batched = (), frozenset()
+
+
+def report(title, batched, separate):
+    sys.stdout.write(
+        "{:<14} {:8.2f} us batched {:8.2f} us per argument\n".format(
+            title, batched * 1e6, separate * 1e6
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
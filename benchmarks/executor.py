@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""Per step overhead of the story executors.
+
+Compare the generic executor loop with the executor generated for the
+story plan.
+
+Run it with `python benchmarks/executor.py`.
+"""
+import sys
+from timeit import repeat
+
+from _stories.context import make_context
+from _stories.history import History
+from _stories.run import Call
+from stories import story
+from stories import Success
+
+
+def make_story(steps):
+    names = ["step%d" % i for i in range(steps)]
+
+    def x(I):
+        for name in names:
+            getattr(I, name)
+
+    def step(self, ctx):
+        return Success()
+
+    namespace = {name: step for name in names}
+    namespace["x"] = story(x)
+    return type("Steps", (object,), namespace)().x
+
+
+def measure(mounted, execute):
+    def call():
+        history = History()
+        ctx, ns, lines, bind = make_context(mounted.contract, {}, history)
+        execute(Call(), ctx, ns, bind, history, mounted.methods, mounted.plan.ends)
+
+    return min(repeat(call, number=2000, repeat=5)) / 2000
+
+
+def main():
+    one, many = make_story(1), make_story(101)
+    for title, engine in [("loop", "executor"), ("generated", "execute")]:
+        first = measure(one, getattr(one.plan, engine))
+        last = measure(many, getattr(many.plan, engine))
+        sys.stdout.write(
+            "{:<10} {:6.3f} us per step\n".format(title, (last - first) / 100 * 1e6)
+        )
+
+
+if __name__ == "__main__":
+    main()
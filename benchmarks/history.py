@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""Per call cost of the story history.
+
+Measure the story call with every history level.  Story has a few
+steps which set context variables, so both history and provenance of
+variables are recorded at the `full` level.
+
+Run it with `python benchmarks/history.py`.
+"""
+import sys
+from timeit import repeat
+
+from stories import arguments
+from stories import story
+from stories import Success
+from stories.settings import configure
+from stories.settings import sampled
+
+
+class Action(object):
+    @story
+    @arguments("foo", "bar")
+    def x(I):
+        I.one
+        I.two
+        I.three
+        I.four
+
+    def one(self, ctx):
+        ctx.baz = ctx.foo + ctx.bar
+        return Success()
+
+    def two(self, ctx):
+        ctx.spam = ctx.baz * 2
+        return Success()
+
+    def three(self, ctx):
+        ctx.ham = ctx.spam - 1
+        return Success()
+
+    def four(self, ctx):
+        return Success()
+
+
+def main():
+    x = Action().x
+
+    def call():
+        x(foo=1, bar=2)
+
+    for level in ["full", sampled(0.1), "off"]:
+        configure(history=level)
+        call()
+        result = min(repeat(call, number=10000, repeat=5)) / 10000
+        sys.stdout.write("{!r:<14} {:6.3f} us per call\n".format(level, result * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""Story call with memoized validation of its arguments.
+
+Arguments of the story are immutable and the same on every call.
+Compare validation on each call with results taken from the cache.
+
+Run it with `python benchmarks/memo.py`.
+"""
+import sys
+from timeit import repeat
+from typing import Tuple
+
+from pydantic import BaseModel
+
+from stories import arguments
+from stories import story
+from stories import Success
+from stories.settings import configure
+from stories.settings import memo_counters
+
+
+class Action(object):
+    @story
+    @arguments("user_id", "kind", "tags")
+    def x(I):
+        I.one
+
+    def one(self, ctx):
+        return Success()
+
+    @x.contract
+    class Contract(BaseModel):
+        user_id: int
+        kind: str
+        tags: Tuple[str, ...]
+
+
+def main():
+    x = Action().x
+
+    def call():
+        x(user_id="1", kind="admin", tags=("a", "b", "c"))
+
+    for size in [0, 1024]:
+        configure(memo=size)
+        call()
+        result = min(repeat(call, number=10000, repeat=5)) / 10000
+        sys.stdout.write("memo={:<6} {:6.3f} us per call\n".format(size, result * 1e6))
+    sys.stdout.write("{!r}\n".format(memo_counters()))
+
+
+if __name__ == "__main__":
+    main()
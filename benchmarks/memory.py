@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""Peak memory of the story call with a large context variable.
+
+The same list is assigned to the context once and four times.  Every
+validated assignment stores a normalized copy of the list, while the
+peak of the story with shallow fields does not grow with the number of
+assignments.
+
+Run it with `python benchmarks/memory.py`.
+"""
+import sys
+import tracemalloc
+from typing import List
+
+from pydantic import BaseModel
+
+from stories import arguments
+from stories import story
+from stories import Success
+
+
+class Contract(BaseModel):
+    data: List[int]
+    first: List[int]
+    second: List[int]
+    third: List[int]
+    fourth: List[int]
+
+
+class Action(object):
+    @story
+    @arguments("data")
+    def once(I):
+        I.one
+
+    @story
+    @arguments("data")
+    def many(I):
+        I.one
+        I.two
+        I.three
+        I.four
+
+    def one(self, ctx):
+        ctx.first = ctx.data
+        return Success()
+
+    def two(self, ctx):
+        ctx.second = ctx.data
+        return Success()
+
+    def three(self, ctx):
+        ctx.third = ctx.data
+        return Success()
+
+    def four(self, ctx):
+        ctx.fourth = ctx.data
+        return Success()
+
+    once.contract(Contract)
+    many.contract(Contract)
+
+
+class ShallowAction(Action):
+    @story
+    @arguments("data")
+    def once(I):
+        I.one
+
+    @story
+    @arguments("data")
+    def many(I):
+        I.one
+        I.two
+        I.three
+        I.four
+
+    once.contract(Contract)
+    many.contract(Contract)
+    once.shallow("data", "first")
+    many.shallow("data", "first", "second", "third", "fourth")
+
+
+def measure(x, data):
+    x(data=data)
+    tracemalloc.start()
+    x(data=data)
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    data = list(range(100000))
+    for name, action in [("full", Action()), ("shallow", ShallowAction())]:
+        for story_name in ["once", "many"]:
+            peak = measure(getattr(action, story_name), data)
+            sys.stdout.write(
+                "{:<8} {:<5} {:8.1f} KiB peak\n".format(name, story_name, peak / 1024)
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""Skip a deep substory composition.
+
+Each substory in the composition returns `Skip` from its first step.
+Everything after it in the substory should be passed over by the
+executor.
+
+Run it with `python benchmarks/skip.py`.
+"""
+import sys
+from timeit import repeat
+
+from stories import Skip
+from stories import story
+from stories import Success
+
+
+class Leaf(object):
+    @story
+    def x(I):
+        I.one
+        I.two
+        I.three
+
+    def one(self, ctx):
+        return Success()
+
+    def two(self, ctx):
+        return Success()
+
+    def three(self, ctx):
+        return Success()
+
+
+class Node(object):
+    def __init__(self, x):
+        self.x = x
+
+    @story
+    def y(I):
+        I.x
+        I.x
+
+    @story
+    def z(I):
+        I.skip
+        I.y
+        I.y
+
+    def skip(self, ctx):
+        return Skip()
+
+
+class Root(object):
+    def __init__(self, z):
+        self.z = z
+
+    @story
+    def a(I):
+        I.z
+        I.z
+        I.z
+        I.z
+        I.z
+        I.z
+        I.z
+        I.z
+
+
+def make_story(depth):
+    substory = Leaf().x
+    for _level in range(depth):
+        substory = Node(substory).y
+    return Root(Node(substory).z).a
+
+
+def main():
+    for depth in [1, 2, 4, 6, 8]:
+        story = make_story(depth)
+        steps = len(story.methods)
+        best = min(repeat(story, number=1000, repeat=5))
+        sys.stdout.write(
+            "depth={:<2} entries={:<5} {:8.2f} us per call\n".format(
+                depth, steps, best * 1000
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""Per call cost of the story proven by the static analysis.
+
+Measure the story call before and after the story was trusted.  Story
+steps set variables declared by the raw contract, so the call cost is
+dominated by checks of assigned names.
+
+Run it with `python benchmarks/trust.py`.
+"""
+import sys
+from timeit import repeat
+
+from stories import arguments
+from stories import story
+from stories import Success
+from stories.analyze import trust
+
+
+def integer(value):
+    return value, None
+
+
+class Action(object):
+    @story
+    @arguments("foo")
+    def x(I):
+        I.one
+        I.two
+        I.three
+
+    def one(self, ctx):
+        ctx.bar = ctx.foo + 1
+        return Success()
+
+    def two(self, ctx):
+        ctx.baz = ctx.bar + 1
+        return Success()
+
+    def three(self, ctx):
+        ctx.spam = ctx.baz + 1
+        return Success()
+
+    x.contract({"foo": integer, "bar": integer, "baz": integer, "spam": integer})
+
+
+def measure():
+    x = Action().x
+
+    def call():
+        x(foo=1)
+
+    call()
+    return min(repeat(call, number=10000, repeat=5)) / 10000
+
+
+def main():
+    sys.stdout.write("checked {:6.3f} us per call\n".format(measure() * 1e6))
+    sys.stdout.write(repr(trust(Action().x)) + "\n")
+    sys.stdout.write("trusted {:6.3f} us per call\n".format(measure() * 1e6))
+
+
+if __name__ == "__main__":
+    main()
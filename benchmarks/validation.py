@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""Per call cost of the context contract validation.
+
+Measure the story call with every validation level.  Story has a few
+steps which set context variables declared by the pydantic contract.
+
+Run it with `python benchmarks/validation.py`.
+"""
+import sys
+from timeit import repeat
+from typing import List
+
+from pydantic import BaseModel
+
+from stories import arguments
+from stories import story
+from stories import Success
+from stories.settings import configure
+from stories.settings import sampled
+
+
+class Action(object):
+    @story
+    @arguments("foo", "bar")
+    def x(I):
+        I.one
+        I.two
+        I.three
+
+    def one(self, ctx):
+        ctx.baz = ctx.foo + ctx.bar
+        return Success()
+
+    def two(self, ctx):
+        ctx.spam = [ctx.baz] * 3
+        return Success()
+
+    def three(self, ctx):
+        return Success()
+
+    @x.contract
+    class Contract(BaseModel):
+        foo: int
+        bar: int
+        baz: int
+        spam: List[int]
+
+
+def main():
+    x = Action().x
+
+    def call():
+        x(foo=1, bar=2)
+
+    for level in ["full", sampled(0.1), "arguments", "off"]:
+        configure(validation=level)
+        call()
+        result = min(repeat(call, number=10000, repeat=5)) / 10000
+        sys.stdout.write("{!r:<14} {:6.3f} us per call\n".format(level, result * 1e6))
+
+
+if __name__ == "__main__":
+    main()
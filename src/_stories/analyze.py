@@ -0,0 +1,411 @@
+# -*- coding: utf-8 -*-
+import ast
+import sys
+from importlib import import_module
+from inspect import getsource
+from inspect import isclass
+from inspect import ismethod
+from inspect import ismodule
+from textwrap import dedent
+
+from _stories.compat import Enum
+from _stories.exceptions import FailureProtocolError
+from _stories.marker import BeginningOfStory
+from _stories.marker import EndOfStory
+from _stories.mounted import ClassMountedStory
+from _stories.mounted import make_steps_key
+from _stories.mounted import trust_methods
+from _stories.returned import Failure
+from _stories.returned import Result
+from _stories.returned import Skip
+from _stories.returned import Success
+
+
+# Source code of each step is parsed.  Context variables assigned and
+# read by the step are checked against the contract and the order of
+# steps.  Failure reasons are checked against the failure protocol.
+
+
+def analyze(story):
+    report = Report(story.cls_name, story.name)
+    known = dict.fromkeys(story.arguments, "story argument")
+    # Steps could set arguments of substories.  Trusted call should
+    # not pass them.
+    assignable = set(story.methods[0][1].argset) - set(known)
+    for index, (method, contract, protocol) in enumerate(story.methods):
+        if type(method) in (BeginningOfStory, EndOfStory):
+            continue
+        node = parse_step(report, method)
+        if node is None:
+            continue
+        analyze_step(report, known, assignable, method, contract, node)
+        if analyze_failures(report, method, protocol, node):
+            report.checked.add(index)
+    return report
+
+
+def trust(story):
+    # Every instance mounting the same steps is trusted from now on.
+    # Calls passing arguments assigned by its steps are checked as usual.
+    report = analyze(story)
+    if not report.errors:
+        trusted = (frozenset(report.arguments), frozenset(report.checked))
+        story.plan.trusted[make_steps_key(story.callables)] = trusted
+        story.trusted = trusted[0]
+        story.methods = trust_methods(story.methods, trusted[1])
+    return report
+
+
+def parse_step(report, method):
+    function = getattr(method, "__func__", method)
+    try:
+        tree = ast.parse(dedent(getsource(function)))
+    except (IOError, OSError, TypeError, SyntaxError):
+        tree = None
+    if tree is None or not (
+        isinstance(tree.body[0], function_types)
+        and tree.body[0].name == function.__name__
+    ):
+        report.errors.append(no_source_template.format(step=format_step(method)))
+        return None
+    # Source of the decorated function is the source of the wrapped one.
+    # It is not the code which runs.
+    if hasattr(function, "__wrapped__") or tree.body[0].decorator_list:
+        report.errors.append(decorated_template.format(step=format_step(method)))
+        return None
+    return tree.body[0]
+
+
+def analyze_step(report, known, assignable, method, contract, node):
+    step = format_step(method)
+    position = 1 if ismethod(method) else 0
+    if len(node.args.args) <= position:
+        report.errors.append(escape_template.format(step=step))
+        return
+    param = node.args.args[position]
+    name = getattr(param, "arg", getattr(param, "id", None))  # Python 2.
+
+    if has_escapes(node, name):
+        report.errors.append(escape_template.format(step=step))
+        return
+
+    writes = count_body_writes(node.body, name)
+    for variable in sorted(writes):
+        if contract.spec is not None and variable not in contract.variables:
+            message = unknown_template.format(step=step, variable=variable)
+            report.errors.append(message)
+        if variable in known:
+            message = override_template.format(
+                step=step, variable=variable, other=known[variable]
+            )
+            report.errors.append(message)
+        elif writes[variable] > 1:
+            message = repeated_template.format(step=step, variable=variable)
+            report.errors.append(message)
+        elif variable in assignable:
+            report.arguments.add(variable)
+
+    for variable in sorted(find_reads(node, name)):
+        if variable not in known and variable not in writes and (
+            variable not in assignable
+        ):
+            message = missed_template.format(step=step, variable=variable)
+            report.warnings.append(message)
+
+    for variable in writes:
+        known.setdefault(variable, step)
+
+
+def analyze_failures(report, method, protocol, node):
+    # Reasons are literals and enumeration members.  Return `True` if
+    # every value returned by the step is a marker with a valid reason.
+    # Wrapper of the decorated step could return anything.
+    if not ismethod(method):
+        return False
+    if hasattr(method.__func__, "__wrapped__") or node.decorator_list:
+        return False
+    namespace = method.__func__.__globals__
+    step = format_step(method)
+    valid = {}
+    for child in ast.walk(node):
+        if isinstance(child, ast.Call) and resolve(child.func, namespace) is Failure:
+            found, reason = get_reason(child, namespace)
+            valid[id(child)] = found and is_valid_reason(protocol, method, reason)
+            if found and not valid[id(child)]:
+                message = wrong_reason_template.format(
+                    step=step, failure=repr(Failure(reason))
+                )
+                report.errors.append(message)
+    for returned in find_returns(node):
+        value = returned.value
+        if value is None:
+            continue
+        elif not isinstance(value, ast.Call):
+            return False
+        marker = resolve(value.func, namespace)
+        if marker is Failure:
+            if not valid[id(value)]:
+                return False
+        elif marker not in (Result, Skip, Success):
+            return False
+    return True
+
+
+def get_reason(node, namespace):
+    if node.keywords and [keyword.arg for keyword in node.keywords] == ["reason"]:
+        args = [node.keywords[0].value]
+    elif not node.keywords:
+        args = node.args
+    else:
+        return False, None
+    if not args:
+        return True, None
+    elif len(args) != 1 or type(args[0]).__name__ == "Starred":
+        return False, None
+    try:
+        return True, ast.literal_eval(args[0])
+    except (ValueError, TypeError, SyntaxError):
+        pass
+    reason = resolve(args[0], namespace)
+    if isinstance(reason, Enum):
+        return True, reason
+    return False, None
+
+
+def is_valid_reason(protocol, method, reason):
+    try:
+        protocol.check_return_statement(method, reason)
+    except FailureProtocolError:
+        return False
+    return True
+
+
+def resolve(node, namespace):
+    # Global name or attribute of the module or class.
+    if isinstance(node, ast.Name):
+        return namespace.get(node.id)
+    elif isinstance(node, ast.Attribute):
+        value = resolve(node.value, namespace)
+        if isclass(value) or ismodule(value):
+            return getattr(value, node.attr, None)
+
+
+def find_returns(node):
+    # Nested functions have their own return statements.
+    returns = []
+    for child in ast.iter_child_nodes(node):
+        if isinstance(child, scope_types):
+            continue
+        elif isinstance(child, ast.Return):
+            returns.append(child)
+        returns.extend(find_returns(child))
+    return returns
+
+
+def format_step(method):
+    if ismethod(method):
+        return method.__self__.__class__.__name__ + "." + method.__name__
+    return getattr(method, "__name__", repr(method))
+
+
+# Nodes.
+
+
+function_types = tuple(
+    getattr(ast, name)
+    for name in ["FunctionDef", "AsyncFunctionDef"]
+    if hasattr(ast, name)
+)
+
+
+scope_types = function_types + (ast.Lambda, ast.ClassDef)
+
+
+# Function arguments are names in the parameter context on Python 2.
+param_types = (ast.Param,) if sys.version_info[0] == 2 else ()
+
+
+# Nodes which body could be executed more than once.
+repeated_types = tuple(
+    getattr(ast, name)
+    for name in [
+        "For",
+        "AsyncFor",
+        "While",
+        "FunctionDef",
+        "AsyncFunctionDef",
+        "Lambda",
+        "ListComp",
+        "SetComp",
+        "DictComp",
+        "GeneratorExp",
+    ]
+    if hasattr(ast, name)
+)
+
+
+def is_context_attribute(node, name):
+    return (
+        isinstance(node, ast.Attribute)
+        and isinstance(node.value, ast.Name)
+        and node.value.id == name
+    )
+
+
+def has_escapes(node, name):
+    # Context passed to the function, aliased, rebound, or used by its
+    # private attributes like `__setattr__` could assign anything.
+    attributes = set()
+    for child in ast.walk(node):
+        if is_context_attribute(child, name):
+            if child.attr.startswith("_"):
+                return True
+            attributes.add(id(child.value))
+    for child in ast.walk(node):
+        if (
+            isinstance(child, ast.Name)
+            and child.id == name
+            and id(child) not in attributes
+            and not isinstance(child.ctx, param_types)
+        ):
+            return True
+    return False
+
+
+def count_body_writes(body, name):
+    counts = {}
+    for node in body:
+        add_counts(counts, count_writes(node, name))
+    return counts
+
+
+def count_writes(node, name):
+    # Branches of the `if` statement are exclusive.  Assignment made by
+    # the loop or nested function could happen many times.
+    if isinstance(node, ast.If):
+        counts = count_body_writes(node.body, name)
+        for variable, count in count_body_writes(node.orelse, name).items():
+            counts[variable] = max(counts.get(variable, 0), count)
+        return counts
+    counts = {}
+    if is_context_attribute(node, name) and isinstance(node.ctx, ast.Store):
+        counts[node.attr] = 1
+    for child in ast.iter_child_nodes(node):
+        add_counts(counts, count_writes(child, name))
+    if isinstance(node, repeated_types):
+        counts = dict.fromkeys(counts, 2)
+    return counts
+
+
+def add_counts(counts, other):
+    for variable, count in other.items():
+        counts[variable] = counts.get(variable, 0) + count
+
+
+def find_reads(node, name):
+    return {
+        child.attr
+        for child in ast.walk(node)
+        if is_context_attribute(child, name) and isinstance(child.ctx, ast.Load)
+    }
+
+
+# Report.
+
+
+class Report(object):
+    # Errors prevent the story from being trusted.  Warnings do not.
+
+    def __init__(self, cls_name, name):
+        self.cls_name = cls_name
+        self.name = name
+        self.errors = []
+        self.warnings = []
+        self.arguments = set()
+        self.checked = set()
+
+    def __repr__(self):
+        status = "not proven" if self.errors else "proven"
+        lines = [self.cls_name + "." + self.name + ": " + status]
+        lines.extend("  error: " + error for error in self.errors)
+        lines.extend("  warning: " + warning for warning in self.warnings)
+        return "\n".join(lines)
+
+
+# Command line.
+
+
+def main(argv=None):
+    # Targets are module names or `module:Class` strings.  Classes are
+    # instantiated without arguments.
+    targets = sys.argv[1:] if argv is None else argv
+    if not targets:
+        sys.stderr.write(usage_template + "\n")
+        return 2
+    failed = False
+    for target in targets:
+        for cls in find_classes(target):
+            for name in find_stories(cls):
+                try:
+                    story = getattr(cls(), name)
+                except Exception as error:
+                    message = skipped_template.format(
+                        cls=cls.__name__, method=name, error=error
+                    )
+                    sys.stdout.write(message + "\n")
+                    continue
+                report = analyze(story)
+                sys.stdout.write(repr(report) + "\n")
+                failed = failed or bool(report.errors)
+    return 1 if failed else 0
+
+
+def find_classes(target):
+    module_name, _, cls_name = target.partition(":")
+    module = import_module(module_name)
+    if cls_name:
+        return [getattr(module, cls_name)]
+    return [
+        value
+        for _name, value in sorted(vars(module).items())
+        if isclass(value) and value.__module__ == module.__name__
+    ]
+
+
+def find_stories(cls):
+    return [
+        name for name in dir(cls) if type(getattr(cls, name, None)) is ClassMountedStory
+    ]
+
+
+# Messages.
+
+
+no_source_template = "{step} source code could not be analyzed"
+
+
+decorated_template = "{step} is decorated and could not be analyzed"
+
+
+escape_template = "{step} uses context in the way which could not be analyzed"
+
+
+unknown_template = "{step} assigns variable {variable!r} unknown to the contract"
+
+
+override_template = "{step} assigns variable {variable!r} set by {other}"
+
+
+repeated_template = "{step} could assign variable {variable!r} many times"
+
+
+missed_template = "{step} reads variable {variable!r} before it is assigned"
+
+
+wrong_reason_template = "{step} returns {failure} not allowed by the failure protocol"
+
+
+skipped_template = "{cls}.{method}: skipped, {error}"
+
+
+usage_template = "Usage: python -m stories.analyze module[:Class] ..."
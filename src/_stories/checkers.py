@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+from itertools import islice
+
+from _stories.compat import Any
+from _stories.compat import ClassVar
+from _stories.compat import Collection
+from _stories.compat import get_type_hints
+from _stories.compat import Literal
+from _stories.compat import Union
+from _stories.settings import settings
+
+
+# Checker returns `None` for valid value.  Otherwise, it returns the
+# expected type, the actual type and the path to the invalid element.
+
+
+def compile_annotations(spec):
+    # Class variables are attributes of the contract, not the context.
+    return {
+        name: (annotation, compile_checker(annotation))
+        for name, annotation in get_type_hints(spec).items()
+        if not is_class_var(annotation)
+    }
+
+
+def compile_checker(annotation):
+    annotation = strip_annotated(annotation)
+    origin = getattr(annotation, "__origin__", None)
+    args = getattr(annotation, "__args__", None) or ()
+
+    if annotation is Any or annotation is object:
+        return check_any
+    elif origin is Union or type(annotation).__name__ == "UnionType":
+        return make_union_checker(annotation, list(map(compile_checker, args)))
+    elif origin is Literal:
+        return make_literal_checker(annotation, args)
+    elif is_typed_dict(annotation):
+        return make_typed_dict_checker(annotation)
+
+    origin = getattr(origin, "__extra__", origin)  # Python 3.6.
+
+    if origin is tuple and is_empty_tuple(annotation):
+        return make_tuple_checker(annotation, [])
+    elif origin is tuple and args and args[-1] is not Ellipsis:
+        return make_tuple_checker(annotation, list(map(compile_checker, args)))
+    elif isinstance(origin, type) and hasattr(origin, "items") and len(args) == 2:
+        return make_mapping_checker(
+            annotation, origin, compile_checker(args[0]), compile_checker(args[1])
+        )
+    elif isinstance(origin, type) and hasattr(origin, "__iter__") and args:
+        return make_iterable_checker(annotation, origin, compile_checker(args[0]))
+    else:
+        return compile_shape(annotation)
+
+
+def compile_shape(annotation):
+    # Type of the value is checked without its elements.
+    annotation = strip_annotated(annotation)
+    origin = getattr(annotation, "__origin__", None)
+    args = getattr(annotation, "__args__", None) or ()
+
+    if annotation is Any or annotation is object:
+        return check_any
+    elif origin is Union or type(annotation).__name__ == "UnionType":
+        return make_union_checker(annotation, list(map(compile_shape, args)))
+    elif origin is Literal:
+        return make_literal_checker(annotation, args)
+    elif is_typed_dict(annotation):
+        return make_instance_checker(annotation, dict)
+
+    origin = getattr(origin, "__extra__", origin)  # Python 3.6.
+
+    if isinstance(origin, type):
+        return make_instance_checker(annotation, origin)
+    elif annotation is float:
+        return make_instance_checker(annotation, (int, float))
+    elif annotation is complex:
+        return make_instance_checker(annotation, (int, float, complex))
+    elif isinstance(annotation, type):
+        return make_instance_checker(annotation, annotation)
+    else:
+        # Type variables and unresolved forward references.
+        return check_any
+
+
+def strip_annotated(annotation):
+    while hasattr(annotation, "__metadata__"):
+        annotation = annotation.__origin__
+    return annotation
+
+
+def is_class_var(annotation):
+    return (
+        annotation is ClassVar
+        or getattr(annotation, "__origin__", None) is ClassVar
+        or type(annotation).__name__ == "_ClassVar"  # Python 3.6.
+    )
+
+
+def is_empty_tuple(annotation):
+    # `Tuple[()]` has no arguments on new Python versions and a single
+    # empty tuple argument on old ones.  Bare `Tuple` has no arguments
+    # either, but it is marked as special.
+    args = getattr(annotation, "__args__", None)
+    return args == ((),) or (args == () and not getattr(annotation, "_special", False))
+
+
+def is_typed_dict(annotation):
+    return (
+        isinstance(annotation, type)
+        and issubclass(annotation, dict)
+        and hasattr(annotation, "__total__")
+    )
+
+
+def format_type(annotation):
+    annotation = strip_annotated(annotation)
+    if getattr(annotation, "__origin__", None) is None and hasattr(
+        annotation, "__name__"
+    ):
+        return annotation.__name__
+    return repr(annotation).replace("typing.", "")
+
+
+def format_check_error(error):
+    expected, actual, path = error
+    message = "Expected {}, got {}".format(expected, actual)
+    if path:
+        message += " at " + "".join("[{!r}]".format(key) for key in path)
+    return message
+
+
+# Checkers.
+
+
+def check_any(value):
+    return None
+
+
+def make_instance_checker(annotation, types):
+    expected = format_type(annotation)
+
+    def check(value):
+        if isinstance(value, types):
+            return None
+        return expected, type(value).__name__, ()
+
+    return check
+
+
+def make_union_checker(annotation, checkers):
+    expected = format_type(annotation)
+
+    def check(value):
+        nested = None
+        for checker in checkers:
+            error = checker(value)
+            if error is None:
+                return None
+            elif error[2]:
+                # Value has a type of the container but its element is invalid.
+                nested = error
+        if nested is not None:
+            return nested
+        return expected, type(value).__name__, ()
+
+    return check
+
+
+def make_literal_checker(annotation, values):
+    expected = format_type(annotation)
+
+    def check(value):
+        for allowed in values:
+            if type(value) is type(allowed) and value == allowed:
+                return None
+        return expected, repr(value), ()
+
+    return check
+
+
+def make_iterable_checker(annotation, origin, checker):
+    expected = format_type(annotation)
+
+    def check(value):
+        if not isinstance(value, origin) or isinstance(value, (str, bytes)):
+            return expected, type(value).__name__, ()
+        if not isinstance(value, Collection):
+            # Iterators and generators would be exhausted by the check.
+            return None
+        for index, element in sample(value):
+            error = checker(element)
+            if error is not None:
+                return error[0], error[1], (index,) + error[2]
+        return None
+
+    return check
+
+
+def make_tuple_checker(annotation, checkers):
+    expected = format_type(annotation)
+    length = len(checkers)
+
+    def check(value):
+        if not isinstance(value, tuple) or len(value) != length:
+            return expected, type(value).__name__, ()
+        for index, (checker, element) in enumerate(zip(checkers, value)):
+            error = checker(element)
+            if error is not None:
+                return error[0], error[1], (index,) + error[2]
+        return None
+
+    return check
+
+
+def make_mapping_checker(annotation, origin, key_checker, value_checker):
+    expected = format_type(annotation)
+
+    def check(value):
+        if not isinstance(value, origin):
+            return expected, type(value).__name__, ()
+        for _index, key in sample(value):
+            error = key_checker(key)
+            if error is not None:
+                return error
+            error = value_checker(value[key])
+            if error is not None:
+                return error[0], error[1], (key,) + error[2]
+        return None
+
+    return check
+
+
+def make_typed_dict_checker(annotation):
+    expected = format_type(annotation)
+    fields = compile_annotations(annotation)
+    required = getattr(
+        annotation,
+        "__required_keys__",
+        frozenset(fields) if annotation.__total__ else frozenset(),
+    )
+
+    def check(value):
+        if not isinstance(value, dict):
+            return expected, type(value).__name__, ()
+        for key, (field, checker) in fields.items():
+            if key not in value:
+                if key in required:
+                    return format_type(field), "nothing", (key,)
+                continue
+            error = checker(value[key])
+            if error is not None:
+                return error[0], error[1], (key,) + error[2]
+        return None
+
+    return check
+
+
+def sample(value):
+    # Every element, none of them, or evenly spaced part of them.
+    level = settings["containers"]
+    if level == "full":
+        return enumerate(value)
+    elif level == "shallow" or not level.rate:
+        return ()
+    else:
+        return islice(enumerate(value), 0, None, int(round(1 / level.rate)))
@@ -54,6 +54,28 @@ except ImportError:
         pass
 
 
+try:
+    from msgspec import convert as msgspec_convert
+    from msgspec import Struct
+    from msgspec import ValidationError as MsgspecError
+    from msgspec.structs import fields as msgspec_fields
+
+    MsgspecSpec = type(Struct)
+except ImportError:
+    # Msgspec package is not installed.
+    class MsgspecSpec(object):
+        pass
+
+    class MsgspecError(object):
+        pass
+
+    def msgspec_convert(obj, cls, strict=True):
+        pass
+
+    def msgspec_fields(type_or_instance):
+        pass
+
+
 try:
     from cerberus import Validator as CerberusSpec
 except ImportError:
@@ -62,6 +84,39 @@ except ImportError:
         pass
 
 
+try:
+    from typing import Any, ClassVar, get_type_hints, Union
+except ImportError:  # pragma: no cover
+    # We are on Python 2.7
+    class Any(object):
+        pass
+
+    class ClassVar(object):
+        pass
+
+    class Union(object):
+        pass
+
+    def get_type_hints(obj):
+        return {}
+
+
+try:
+    from typing import Literal
+except ImportError:
+    # We are on Python older than 3.8
+    class Literal(object):
+        pass
+
+
+try:
+    from collections.abc import Collection
+except ImportError:
+    # We are on Python older than 3.6
+    class Collection(object):
+        pass
+
+
 try:
     from textwrap import indent
 except ImportError:
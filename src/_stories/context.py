@@ -1,81 +1,153 @@
 # -*- coding: utf-8 -*-
 from collections import OrderedDict
 from decimal import Decimal
+from itertools import islice
 
 from _stories.compat import indent
 from _stories.exceptions import MutationError
+from _stories.history import format_events
 
 
-def make_context(contract, kwargs, history):
+def make_context(contract, kwargs, history, validation="full"):
     ns = OrderedDict()
-    seen = []
-    kwargs = contract.check_story_call(kwargs, ns, seen)
-    for arg in sorted(contract.argset):
-        # FIXME: We should be able to remove `if` statement here.
-        if arg in kwargs:
+    seen = {}
+    if validation == "off":
+        kwargs = contract.check_unknown_arguments(kwargs)
+    else:
+        kwargs = contract.check_story_call(kwargs, ns, seen)
+    if contract.spec is None:
+        # Arguments are not normalized without contract.  All of them
+        # are known to the story at this point.
+        for arg in sorted(kwargs):
             ns[arg] = kwargs[arg]
-    lines = ["Story argument"] * len(ns)
-    this = {}
+        seen = None
+    else:
+        for arg in contract.ordered_argset:
+            # FIXME: We should be able to remove `if` statement here.
+            if arg in kwargs:
+                ns[arg] = kwargs[arg]
+        if validation != "full":
+            # Assigned variables are checked to be known to the
+            # contract, but their values are stored as is.
+            seen = None
+    if history.recorded:
+        lines = ["Story argument"] * len(ns)
+    else:
+        # Provenance of variables is not recorded as well as history.
+        lines = None
+    ctx = Context(ns, lines, history, seen)
+    return ctx, ns, lines, ctx._Context__bind
+
+
+def trust_context(ctx):
+    # Steps of the story were proven to assign known variables once.
+    object.__setattr__(ctx, "_Context__trusted", True)
+
+
+class Context(object):
+    # Names of the private slots are mangled, so they could not clash
+    # with context variables.  Empty `__dict__` is there to not expose
+    # them in the `ctx.__dict__`.
+    __slots__ = (
+        "__ns",
+        "__lines",
+        "__history",
+        "__seen",
+        "__binding",
+        "__trusted",
+        "__dict__",
+    )
 
-    def getattr_method(self, name):
+    def __init__(self, ns, lines, history, seen):
+        object.__setattr__(self, "_Context__ns", ns)
+        object.__setattr__(self, "_Context__lines", lines)
+        object.__setattr__(self, "_Context__history", history)
+        object.__setattr__(self, "_Context__seen", seen)
+        object.__setattr__(self, "_Context__binding", [None, None])
+        object.__setattr__(self, "_Context__trusted", False)
+
+    def __bind(self, contract, method):
+        binding = self.__binding
+        binding[0] = contract
+        binding[1] = method
+
+    def __getattr__(self, name):
+        if name.startswith("_Context__"):
+            # Instance was created without `__init__` call.
+            raise AttributeError(name)
         try:
-            return ns[name]
+            return self.__ns[name]
         except KeyError:
             raise AttributeError(
                 missed_attribute_message.format(attribute=name, ctx=self)
             )
 
-    def setattr_method(self, name, value):
-        contract = this["contract"]
-        method = this["method"]
-        ns[name] = contract.check_assign_statement(method, self, ns, seen, name, value)
-        lines.append(
-            "Set by {}.{}".format(method.__self__.__class__.__name__, method.__name__)
-        )
+    def __setattr__(self, name, value):
+        contract, method = self.__binding
+        ns, seen = self.__ns, self.__seen
+        if seen is None:
+            if name in ns or (
+                contract.spec is not None and name not in contract.variables
+            ):
+                # Raise variable override or unknown variable error.
+                contract.check_assign_name(method, self, ns, name)
+            ns[name] = value
+        else:
+            ns[name] = contract.check_assign_statement(
+                method, self, ns, seen, name, value, self.__trusted
+            )
+        lines = self.__lines
+        if lines is not None:
+            lines.append(
+                "Set by {}.{}".format(
+                    method.__self__.__class__.__name__, method.__name__
+                )
+            )
 
-    def repr_method(self):
+    def __delattr__(self, name):
+        raise MutationError(delete_attribute_message)
+
+    def __repr__(self):
         return (
-            history_representation(history) + "\n\n" + context_representation(ns, lines)
+            history_representation(self.__history)
+            + "\n\n"
+            + context_representation(self.__ns, self.__lines)
         )
 
-    def dir_method(self):
+    def __dir__(self):
         spec = type("Context", (object,), {})
         parent = set(dir(spec()))
-        scope = set(ns)
+        scope = set(self.__ns)
         attributes = sorted(parent | scope)
         return attributes
 
-    def bool_method(self):
+    def __bool__(self):
         # FIXME: It isn't a mutation error.
-        message = comparison_template.format(available=", ".join(map(repr, ns)))
+        message = comparison_template.format(available=", ".join(map(repr, self.__ns)))
         raise MutationError(message)
 
-    def bind(contract, method):
-        this["contract"] = contract
-        this["method"] = method
-
-    return (
-        type(
-            "Context",
-            (object,),
-            {
-                "__getattr__": getattr_method,
-                "__setattr__": setattr_method,
-                "__delattr__": delattr_method,
-                "__repr__": repr_method,
-                "__dir__": dir_method,
-                "__bool__": bool_method,
-                "__nonzero__": bool_method,  # Python 2.
-            },
-        )(),
-        ns,
-        lines,
-        bind,
-    )
+    __nonzero__ = __bool__  # Python 2.
+
 
+class FrozenContext(object):
+    # Context at the moment of the error.  Variables and events are only
+    # appended, so we remember their number and render it later.
 
-def delattr_method(self, name):
-    raise MutationError(delete_attribute_message)
+    def __init__(self, ctx):
+        self.ns = ctx._Context__ns
+        self.lines = ctx._Context__lines
+        self.history = ctx._Context__history
+        self.size = len(self.ns)
+        self.events = len(self.history.events) if self.history.recorded else 0
+
+    def __repr__(self):
+        if self.history.recorded:
+            history_lines = format_events(self.history.events[: self.events])
+        else:
+            history_lines = self.history.lines
+        ns = OrderedDict(islice(self.ns.items(), self.size))
+        lines = None if self.lines is None else self.lines[: self.size]
+        return "\n".join(history_lines) + "\n\n" + context_representation(ns, lines)
 
 
 def history_representation(history):
@@ -83,16 +155,14 @@ def history_representation(history):
 
 
 def context_representation(ns, lines, repr_func=repr):
-    if not lines:
+    if not ns:
         return "Context()"
-    seen = []
+    seen = {}
     items = []
     longest = 0
     for key, value in ns.items():
-        for seen_key, seen_value in seen:
-            if value is seen_value:
-                item = "`{}` alias".format(seen_key)
-                break
+        if id(value) in seen:
+            item = "`{}` alias".format(seen[id(value)])
         else:
             item = repr_func(value)
         too_long = len(key) + len(item) + 4 > 88
@@ -104,15 +174,18 @@ def context_representation(ns, lines, repr_func=repr):
             head = "{}: {}".format(key, item)
             tail = ""
         if type(value) not in [type(None), bool, int, float, Decimal]:
-            seen.append((key, value))
+            seen.setdefault(id(value), key)
         items.append((head, tail))
         head_length = len(head)
         if head_length > longest:
             longest = head_length
-    lines = [
-        "  {}  # {}{}".format(head.ljust(longest), line, tail)
-        for (head, tail), line in zip(items, lines)
-    ]
+    if lines is None:
+        lines = ["  {}{}".format(head, tail) for head, tail in items]
+    else:
+        lines = [
+            "  {}  # {}{}".format(head.ljust(longest), line, tail)
+            for (head, tail), line in zip(items, lines)
+        ]
     return "\n".join(["Context:"] + lines)
 
 
@@ -1,14 +1,31 @@
 # -*- coding: utf-8 -*-
 from inspect import isclass
 from operator import itemgetter
+from threading import local
 
+from _stories.checkers import compile_annotations
+from _stories.checkers import compile_shape
+from _stories.checkers import format_check_error
+from _stories.checkers import format_type
+from _stories.checkers import is_typed_dict
 from _stories.compat import CerberusSpec
 from _stories.compat import Marshmallow2Spec
 from _stories.compat import Marshmallow3Error
 from _stories.compat import Marshmallow3Spec
+from _stories.compat import msgspec_convert
+from _stories.compat import msgspec_fields
+from _stories.compat import MsgspecError
+from _stories.compat import MsgspecSpec
 from _stories.compat import PydanticError
 from _stories.compat import PydanticSpec
+from _stories.compat import Union
+from _stories.context import FrozenContext
 from _stories.exceptions import ContextContractError
+from _stories.exceptions import Deferred
+from _stories.exceptions import Message
+from _stories.exceptions import StoryDefinitionError
+from _stories.memo import memoize
+from _stories.settings import settings
 
 
 # FIXME: Handle protocol extension.  There should be way to say in the
@@ -103,27 +120,65 @@ from _stories.exceptions import ContextContractError
 
 
 class PydanticValidator(object):
+    # Story call arguments of the model are validated in one pass.
+    # Fields are validated one by one, because `validate_model` of the
+    # whole model is slower and mixes in errors of missed fields.
+
     def __init__(self, spec, field):
         self.spec = spec
+        self.key = (id(spec), field.name)
+        self.batch = spec
         self.field = field
 
     def __call__(self, value):
         return self.field.validate(value, {}, loc=self.field.alias, cls=self.spec)
 
+    def validate_many(self, data):
+        fields = self.spec.__fields__
+        values, errors = {}, {}
+        for key, value in data.items():
+            field = fields[key]
+            new_value, error = field.validate(value, {}, loc=field.alias, cls=self.spec)
+            if error:
+                errors[key] = error
+            else:
+                values[key] = new_value
+        return values, errors
+
+    def shape(self):
+        if self.field.allow_none:
+            return Union[self.field.outer_type_, None]
+        return self.field.outer_type_
+
     def __repr__(self):
         return self.field._type_display()
 
 
 class Marshmallow3Validator(object):
-    def __init__(self, spec, field):
+    # Validators of the same schema share its instance.  Story call
+    # arguments are loaded by the schema all at once.
+
+    def __init__(self, spec, schema, field):
         self.spec = spec
+        self.key = (id(spec), field)
+        self.batch = schema
         self.field = field
 
     def __call__(self, value):
+        values, errors = self.validate_many({self.field: value})
+        return values.get(self.field), errors.get(self.field)
+
+    def validate_many(self, data):
         try:
-            return self.spec().load({self.field: value}).get(self.field), None
+            return self.batch.load(data, partial=True), {}
         except Marshmallow3Error as error:
-            return None, error.messages[self.field]
+            return error.valid_data, assign_schema_errors(data, error.messages)
+
+    def shape(self):
+        field = self.spec._declared_fields[self.field]
+        for cls in type(field).__mro__:
+            if cls.__name__ in marshmallow_shapes:
+                return marshmallow_shapes[cls.__name__]
 
     def __repr__(self):
         field = self.spec._declared_fields[self.field]
@@ -131,21 +186,48 @@ class Marshmallow3Validator(object):
 
 
 class Marshmallow2Validator(Marshmallow3Validator):
-    def __call__(self, value):
-        values, errors = self.spec().load({self.field: value})
-        return values.get(self.field), errors.get(self.field)
+    def validate_many(self, data):
+        values, errors = self.batch.load(data, partial=True)
+        return values, assign_schema_errors(data, errors)
+
+
+def assign_schema_errors(data, errors):
+    # Errors of schema validators are not bound to a field.  Each
+    # validated argument without its own error violates the schema.
+    messages = [
+        message for key, error in errors.items() if key not in data for message in error
+    ]
+    if not messages:
+        return errors
+    return {key: errors.get(key, messages) for key in data}
 
 
 class CerberusValidator(object):
-    def __init__(self, spec, field):
+    # Schema of the field and the whole schema are compiled once.
+    # Story call arguments are validated by the whole schema.
+
+    def __init__(self, spec, schema, field):
         self.spec = spec
+        self.key = (id(spec), field)
+        self.batch = schema
         self.field = field
+        self.schema = CerberusSchema({field: spec.schema.schema[field]})
 
     def __call__(self, value):
-        validated = CerberusSpec()
-        validated.validate({self.field: value}, self.spec.schema.schema)
+        validated = self.schema.get_validator()
+        validated.validate({self.field: value})
         return validated.document.get(self.field), validated.errors.get(self.field)
 
+    def validate_many(self, data):
+        validated = self.batch.get_validator()
+        validated.validate(data, update=True)
+        return validated.document, validated.errors
+
+    def shape(self):
+        field_type = self.spec.schema.schema[self.field].get("type")
+        if isinstance(field_type, str):
+            return cerberus_shapes.get(field_type)
+
     def __repr__(self):
         schema = self.spec.schema.schema[self.field]
         field_type = schema["type"]
@@ -154,17 +236,146 @@ class CerberusValidator(object):
         return field_type
 
 
+class CerberusSchema(object):
+    # Validator holds the state of the last validation.  Each thread
+    # compiles its own one.
+
+    def __init__(self, schema):
+        self.schema = schema
+        self.local = local()
+
+    def get_validator(self):
+        try:
+            return self.local.validator
+        except AttributeError:
+            self.local.validator = CerberusSpec(self.schema)
+            return self.local.validator
+
+
+class MsgspecValidator(object):
+    # Values are converted by the compiled converter of the field type.
+    # Lax mode lets strings holding numbers to be normalized the same
+    # way other libraries do.
+
+    def __init__(self, spec, field, types):
+        self.spec = spec
+        self.key = (id(spec), field.name)
+        self.batch = spec
+        self.field = field
+        self.types = types
+
+    def __call__(self, value):
+        try:
+            return msgspec_convert(value, self.field.type, strict=False), None
+        except MsgspecError as error:
+            return None, str(error)
+
+    def validate_many(self, data):
+        values, errors = {}, {}
+        for key, value in data.items():
+            try:
+                values[key] = msgspec_convert(value, self.types[key], strict=False)
+            except MsgspecError as error:
+                errors[key] = str(error)
+        return values, errors
+
+    def shape(self):
+        return self.field.type
+
+    def __repr__(self):
+        return format_type(self.field.type)
+
+
+class AnnotationValidator(object):
+    # Values are checked by compiled `isinstance` checkers.  They are
+    # stored as is.
+
+    def __init__(self, spec, name, annotation, checker):
+        self.spec = spec
+        self.key = (id(spec), name)
+        self.annotation = annotation
+        self.checker = checker
+
+    def __call__(self, value):
+        error = self.checker(value)
+        if error is None:
+            return value, None
+        return None, format_check_error(error)
+
+    def shape(self):
+        return self.annotation
+
+    def __repr__(self):
+        return format_type(self.annotation)
+
+
 class RawValidator(object):
     def __init__(self, validator):
+        self.key = id(validator)
         self.validator = validator
 
     def __call__(self, value):
         return self.validator(value)
 
+    def shape(self):
+        return None
+
     def __repr__(self):
         return self.validator.__name__
 
 
+class ShallowValidator(object):
+    # Values of shallow fields are checked by their type only, without
+    # elements of containers.  The original object is stored in the
+    # context.  Raw validators and fields of unknown type are applied
+    # as usual, but their result is thrown away.
+
+    def __init__(self, validator):
+        self.validator = validator
+        self.key = ("shallow", validator.key)
+        shape = validator.shape()
+        self.checker = None if shape is None else compile_shape(shape)
+
+    def __call__(self, value):
+        if self.checker is None:
+            _new_value, error = self.validator(value)
+            return value, error
+        error = self.checker(value)
+        if error is None:
+            return value, None
+        return None, format_check_error(error)
+
+    def __repr__(self):
+        return repr(self.validator)
+
+
+# Shapes of fields defined by library classes.
+
+
+marshmallow_shapes = {
+    "List": list,
+    "Tuple": tuple,
+    "Dict": dict,
+    "Mapping": dict,
+    "String": str,
+    "Integer": int,
+    "Float": float,
+    "Boolean": bool,
+}
+
+
+cerberus_shapes = {
+    "list": list,
+    "dict": dict,
+    "string": str,
+    "integer": int,
+    "float": float,
+    "number": float,
+    "boolean": bool,
+    "binary": bytes,
+}
+
+
 # Disassemble.
 
 
@@ -185,18 +396,54 @@ def disassemble_marshmallow2(spec):
 
 def disassemble_marshmallow(spec, validator):
     result = {}
+    schema = spec()
     for name in spec._declared_fields:
-        result[name] = validator(spec, name)
+        result[name] = validator(spec, schema, name)
     return result
 
 
 def disassemble_cerberus(spec):
     result = {}
+    schema = CerberusSchema(spec.schema.schema)
     for name in spec.schema:
-        result[name] = CerberusValidator(spec, name)
+        result[name] = CerberusValidator(spec, schema, name)
+    return result
+
+
+def disassemble_msgspec(spec):
+    result = {}
+    fields = msgspec_fields(spec)
+    types = {field.name: field.type for field in fields}
+    for field in fields:
+        result[field.name] = MsgspecValidator(spec, field, types)
     return result
 
 
+def disassemble_annotations(spec):
+    result = {}
+    for name, (annotation, checker) in compile_annotations(spec).items():
+        result[name] = AnnotationValidator(spec, name, annotation, checker)
+    return result
+
+
+def is_annotated_class(spec):
+    # Models of the contract libraries are not plain annotated classes,
+    # even if the version of the library is not supported.
+    if not isclass(spec):
+        return False
+    elif is_typed_dict(spec):
+        return True
+    elif not hasattr(spec, "__annotations__"):
+        return False
+    classes = spec.__mro__ + type(spec).__mro__
+    return all(
+        cls.__module__.split(".")[0] not in contract_libraries for cls in classes
+    )
+
+
+contract_libraries = frozenset(["cerberus", "marshmallow", "msgspec", "pydantic"])
+
+
 def disassemble_raw(spec):
     result = {}
     for name, validator in spec.items():
@@ -207,9 +454,10 @@ def disassemble_raw(spec):
 # Execute.
 
 
-def make_contract(cls_name, name, arguments, spec):
+def make_contract(cls_name, name, arguments, spec, shallow=()):
     __tracebackhide__ = True
     if spec is None:
+        check_shallow_definitions(cls_name, name, shallow, {})
         return NullContract(cls_name, name, arguments)
     elif isinstance(spec, PydanticSpec):
         disassembled = disassemble_pydantic(spec)
@@ -219,9 +467,21 @@ def make_contract(cls_name, name, arguments, spec):
         disassembled = disassemble_marshmallow2(spec)
     elif isinstance(spec, CerberusSpec):
         disassembled = disassemble_cerberus(spec)
+    elif isinstance(spec, MsgspecSpec):
+        disassembled = disassemble_msgspec(spec)
+    elif is_annotated_class(spec):
+        disassembled = disassemble_annotations(spec)
     elif isinstance(spec, dict):
         disassembled = disassemble_raw(spec)
+    else:
+        message = unsupported_contract_template.format(
+            contract=spec, cls=cls_name, method=name
+        )
+        raise ContextContractError(message)
     check_arguments_definitions(cls_name, name, arguments, disassembled)
+    check_shallow_definitions(cls_name, name, shallow, disassembled)
+    for field in shallow:
+        disassembled[field] = ShallowValidator(disassembled[field])
     return SpecContract(cls_name, name, arguments, disassembled, spec)
 
 
@@ -238,24 +498,63 @@ def check_arguments_definitions(cls_name, name, arguments, spec):
         raise ContextContractError(message)
 
 
+def check_shallow_fields(fields):
+    if not fields:
+        raise StoryDefinitionError("Story shallow fields can not be an empty list")
+
+    if not all(isinstance(field, str) for field in fields):
+        message = "Story shallow fields can only be defined with string type"
+        raise StoryDefinitionError(message)
+
+
+def check_shallow_definitions(cls_name, name, shallow, spec):
+    __tracebackhide__ = True
+    undefined = set(shallow) - set(spec)
+    if undefined:
+        message = undefined_shallow_template.format(
+            undefined=", ".join(sorted(undefined)),
+            cls=cls_name,
+            method=name,
+            shallow=", ".join(shallow),
+        )
+        raise ContextContractError(message)
+
+
 class NullContract(object):
+    spec = None
+
     def __init__(self, cls_name, name, arguments):
         self.cls_name = cls_name
         self.name = name
         self.arguments = arguments
         self.make_argset()
+        self.representation = None
+        self.representations = {}
 
     def make_argset(self):
         self.argset = {
             arg: {(None, self.cls_name, self.name)} for arg in self.arguments
         }
 
+    def make_variables(self):
+        # Argsets are combined during story composition.  Known
+        # variables are computed once the composition is compiled.
+        self.ordered_argset = tuple(sorted(self.argset))
+        self.variables = frozenset(self.argset)
+        self.representation = None
+        self.representations = {}
+
     def check_story_call(self, kwargs, ns, seen):
+        __tracebackhide__ = True
+        return self.check_unknown_arguments(kwargs)
+
+    def check_unknown_arguments(self, kwargs):
         __tracebackhide__ = True
         # FIXME: Check required arguments here.
         unknown_arguments = set(kwargs) - set(self.argset)
         if unknown_arguments:
-            message = unknown_argument_template.format(
+            message = Message(
+                unknown_argument_template,
                 unknown=", ".join(sorted(unknown_arguments)),
                 cls=self.cls_name,
                 method=self.name,
@@ -268,29 +567,38 @@ class NullContract(object):
         __tracebackhide__ = True
         missed = set(self.arguments) - set(ns)
         if missed:
-            message = missed_variable_template.format(
+            message = Message(
+                missed_variable_template,
                 missed=", ".join(sorted(missed)),
                 cls=self.cls_name,
                 method=self.name,
                 arguments=", ".join(self.arguments),
-                ctx=ctx,
+                ctx=FrozenContext(ctx),
             )
             raise ContextContractError(message)
 
-    def check_assign_statement(self, method, ctx, ns, seen, name, value):
+    def check_assign_statement(self, method, ctx, ns, seen, name, value, trusted):
+        __tracebackhide__ = True
+        if not trusted:
+            self.check_assign_name(method, ctx, ns, name)
+        return value
+
+    def check_assign_name(self, method, ctx, ns, name):
         __tracebackhide__ = True
         if name in ns:
-            message = variable_override_template.format(
+            message = Message(
+                variable_override_template,
                 variable=name,
                 cls=method.__self__.__class__.__name__,
                 method=method.__name__,
-                ctx=ctx,
+                ctx=FrozenContext(ctx),
             )
             raise ContextContractError(message)
-        return value
 
     def __repr__(self):
-        return self.format_contract_fields(self.argset)
+        if self.representation is None:
+            self.representation = self.format_contract_fields(self.argset)
+        return self.representation
 
     def format_contract_fields(self, *fieldset):
         if not self.argset:
@@ -300,12 +608,25 @@ class NullContract(object):
             field for fields in fieldset for field in fields if field in self.argset
         )
         for argument in arguments:
-            # FIXME: This does not work for story composition when
-            # many stories has the same argument.
-            ((validator, cls_name, name),) = self.argset[argument]
-            lines.append("  {}  # Argument of {}.{}".format(argument, cls_name, name))
+            lines.append(self.format_argument(argument))
         return "\n".join(lines)
 
+    def format_argument(self, argument):
+        # Representation of the argument does not change once the
+        # composition is compiled.
+        try:
+            return self.representations[argument]
+        except KeyError:
+            representation = self.make_argument(argument)
+            self.representations[argument] = representation
+            return representation
+
+    def make_argument(self, argument):
+        # FIXME: This does not work for story composition when
+        # many stories has the same argument.
+        ((validator, cls_name, name),) = self.argset[argument]
+        return "  {}  # Argument of {}.{}".format(argument, cls_name, name)
+
 
 class SpecContract(NullContract):
     # FIXME: Deny empty disassembled spec.  If there is such need, we
@@ -329,78 +650,92 @@ class SpecContract(NullContract):
             for variable, validator in self.spec.items()
         }
 
+    def make_variables(self):
+        super(SpecContract, self).make_variables()
+        self.variables = self.variables | frozenset(self.spec)
+        self.distinct = make_distinct(self.argset)
+        self.batches = make_batches(self.distinct)
+        self.batched = frozenset(
+            key for _validator, keys in self.batches for key in keys
+        )
+
     def check_story_call(self, kwargs, ns, seen):
         __tracebackhide__ = True
-        super(SpecContract, self).check_story_call(kwargs, ns, seen)
-        result, errors = self.validate(kwargs, ns, seen)
+        self.check_unknown_arguments(kwargs)
+        result, errors = self.validate(kwargs, ns, seen, bool(settings["memo"]))
         if errors:
-            message = invalid_argument_template.format(
+            message = Message(
+                invalid_argument_template,
                 variables=", ".join(map(repr, sorted(errors))),
                 cls=self.cls_name,
                 method=self.name,
-                violations=format_violations(kwargs, errors),
-                contract=self.format_contract_fields(errors),
+                violations=Deferred(format_violations, kwargs, errors),
+                contract=Deferred(self.format_contract_fields, errors),
             )
             raise ContextContractError(message)
         return result
 
-    def check_assign_statement(self, method, ctx, ns, seen, name, value):
+    def check_assign_statement(self, method, ctx, ns, seen, name, value, trusted):
         __tracebackhide__ = True
-        super(SpecContract, self).check_assign_statement(
-            method, ctx, ns, seen, name, value
-        )
-        unknown = self.identify(name)
-        if unknown:
-            message = unknown_variable_template.format(
-                unknown=name,
-                cls=method.__self__.__class__.__name__,
-                method=method.__name__,
-                contract=self,
-            )
-            raise ContextContractError(message)
+        if not trusted:
+            self.check_assign_name(method, ctx, ns, name)
         normalized, errors = self.validate({name: value}, ns, seen)
         if errors:
-            message = invalid_variable_template.format(
+            message = Message(
+                invalid_variable_template,
                 variable=name,
                 cls=method.__self__.__class__.__name__,
                 method=method.__name__,
-                violations=format_violations({name: value}, errors),
-                contract=self.format_contract_fields(errors),
+                violations=Deferred(format_violations, {name: value}, errors),
+                contract=Deferred(self.format_contract_fields, errors),
             )
             raise ContextContractError(message)
         return normalized[name]
 
+    def check_assign_name(self, method, ctx, ns, name):
+        __tracebackhide__ = True
+        super(SpecContract, self).check_assign_name(method, ctx, ns, name)
+        unknown = self.identify(name)
+        if unknown:
+            message = Message(
+                unknown_variable_template,
+                unknown=name,
+                cls=method.__self__.__class__.__name__,
+                method=method.__name__,
+                contract=self,
+            )
+            raise ContextContractError(message)
+
     def identify(self, name):
-        available = set(self.spec) | set(self.argset)
-        unknown = name not in available
+        unknown = name not in self.variables
         return unknown
 
-    def validate(self, kwargs, ns, seen):
+    def validate(self, kwargs, ns, seen, memo=False):
+        # Memoized arguments are validated one by one, since the cache
+        # holds results of a single validator.
         __tracebackhide__ = True
         result, errors, conflict = {}, {}, {}
+        if memo:
+            batched = ()
+        else:
+            self.validate_batches(result, errors, ns, seen, kwargs)
+            batched = self.batched
         for key, value in kwargs.items():
-            if key in self.spec:
+            if key in batched:
+                continue
+            elif key in self.spec:
                 self.validate_spec(result, errors, ns, seen, key, value)
             else:
-                self.validate_argset(result, errors, ns, seen, conflict, key, value)
+                self.validate_argset(
+                    result, errors, ns, seen, conflict, key, value, memo
+                )
         if conflict:
             conflict_vars = sorted({j for i in conflict.values() for j in i})
-            message = normalization_conflict_template.format(
+            message = Message(
+                normalization_conflict_template,
                 conflict=", ".join(map(repr, conflict_vars)),
-                results="\n\n".join(
-                    "%s.%s:\n%s"
-                    % (
-                        cls,
-                        method,
-                        "\n".join(
-                            " - {}: {!r}".format(i, result[i]) for i in sorted(result)
-                        ),
-                    )
-                    for (cls, method), result in (
-                        (i, conflict[i]) for i in sorted(conflict)
-                    )
-                ),
-                contract=self.format_contract_fields(conflict_vars),
+                results=Deferred(format_conflict, conflict),
+                contract=Deferred(self.format_contract_fields, conflict_vars),
             )
             raise ContextContractError(message)
         return result, errors
@@ -412,10 +747,27 @@ class SpecContract(NullContract):
         else:
             self.assign_result(result, ns, seen, key, value, new_value)
 
-    def validate_argset(self, result, errors, ns, seen, conflict, key, value):
+    def validate_batches(self, result, errors, ns, seen, kwargs):
+        for validator, keys in self.batches:
+            data = {key: kwargs[key] for key in keys if key in kwargs}
+            if not data:
+                continue
+            new_values, new_errors = validator.validate_many(data)
+            for key, value in data.items():
+                if key in new_errors:
+                    errors[key] = new_errors[key]
+                else:
+                    self.assign_result(
+                        result, ns, seen, key, value, new_values.get(key)
+                    )
+
+    def validate_argset(self, result, errors, ns, seen, conflict, key, value, memo):
         new_values, has_error = [], False
-        for validator, cls_name, name in self.argset[key]:
-            new_value, error = validator(value)
+        for validator, cls_name, name in self.distinct[key]:
+            if memo:
+                new_value, error = memoize(validator, value)
+            else:
+                new_value, error = validator(value)
             if error:
                 has_error = True
                 errors[key] = error
@@ -433,8 +785,11 @@ class SpecContract(NullContract):
             self.assign_result(result, ns, seen, key, value, new_value)
 
     def assign_result(self, result, ns, seen, key, value, new_value):
-        for seen_key, seen_value in seen:
-            if value is seen_value:
+        # Seen values are indexed by their identity.  The value itself
+        # is stored next to the keys to keep its `id` from being reused.
+        identity = id(value)
+        if identity in seen:
+            for seen_key in seen[identity][1]:
                 # It will be `ns` if we are validating previous
                 # assignment.  It will be `result` if we are validating
                 # story call arguments.
@@ -446,11 +801,17 @@ class SpecContract(NullContract):
                 ):
                     result[key] = seen_new_value
                     return
+            seen[identity][1].append(key)
+        else:
+            seen[identity] = (value, [key])
         result[key] = new_value
-        seen.append((key, value))
 
     def __repr__(self):
-        return self.format_contract_fields(self.argset, self.declared)
+        if self.representation is None:
+            self.representation = self.format_contract_fields(
+                self.argset, self.declared
+            )
+        return self.representation
 
     def format_contract_fields(self, *fieldset):
         lines = ["Contract:"]
@@ -458,17 +819,7 @@ class SpecContract(NullContract):
             field for fields in fieldset for field in fields if field in self.argset
         )
         for argument in arguments:
-            validators = self.argset[argument]
-            if len(validators) == 1:
-                ((validator, cls_name, name),) = validators
-                lines.append(
-                    "  %s: %r  # Argument of %s.%s"
-                    % (argument, validator, cls_name, name)
-                )
-            else:
-                lines.append("  {}:".format(argument))
-                for validator in sorted(validators, key=itemgetter(1, 2)):
-                    lines.append("    %r  # Argument of %s.%s" % validator)
+            lines.append(self.format_argument(argument))
         variables = sorted(
             field for fields in fieldset for field in fields if field in self.declared
         )
@@ -481,6 +832,68 @@ class SpecContract(NullContract):
             )
         return "\n".join(lines)
 
+    def make_argument(self, argument):
+        validators = self.argset[argument]
+        if len(validators) == 1:
+            ((validator, cls_name, name),) = validators
+            line = "  %s: %r  # Argument of %s.%s"
+            return line % (argument, validator, cls_name, name)
+        lines = ["  {}:".format(argument)]
+        for validator in sorted(validators, key=itemgetter(1, 2)):
+            lines.append("    %r  # Argument of %s.%s" % validator)
+        return "\n".join(lines)
+
+
+# Distinct validators.
+
+
+def make_distinct(argset):
+    # Equivalent validators brought by the same substory or a shared
+    # contract are applied once.  Representation still shows them all.
+    distinct = {}
+    for key, validators in argset.items():
+        known, result = set(), []
+        for validator in sorted(validators, key=itemgetter(1, 2)):
+            if validator[0].key not in known:
+                known.add(validator[0].key)
+                result.append(validator)
+        distinct[key] = tuple(result)
+    return distinct
+
+
+# Batches.
+
+
+def make_batches(distinct):
+    # Fields of one schema are validated with one `validate_many` call.
+    # Arguments with many distinct validators could conflict, so they
+    # are validated one by one.
+    batches = {}
+    for key in sorted(distinct):
+        if len(distinct[key]) != 1:
+            continue
+        ((validator, _cls_name, _name),) = distinct[key]
+        batch = getattr(validator, "batch", None)
+        if batch is not None:
+            batches.setdefault(id(batch), (validator, []))[1].append(key)
+    return tuple(
+        (validator, tuple(keys))
+        for validator, keys in batches.values()
+        if len(keys) > 1
+    )
+
+
+def format_conflict(conflict):
+    return "\n\n".join(
+        "%s.%s:\n%s"
+        % (
+            cls,
+            method,
+            "\n".join(" - {}: {!r}".format(i, result[i]) for i in sorted(result)),
+        )
+        for (cls, method), result in ((i, conflict[i]) for i in sorted(conflict))
+    )
+
 
 def format_violations(kwargs, errors):
     result = []
@@ -599,6 +1012,25 @@ Story arguments: {arguments}
 """.strip()
 
 
+undefined_shallow_template = """
+These shallow fields should be declared in the context contract: {undefined}
+
+Story method: {cls}.{method}
+
+Shallow fields: {shallow}
+""".strip()
+
+
+unsupported_contract_template = """
+This context contract is not supported: {contract!r}
+
+Story method: {cls}.{method}
+
+Use a class with annotations, a typed dict, a dict of validators or a
+model of the supported contract library.
+""".strip()
+
+
 missed_variable_template = """
 These variables are missing from the context: {missed}
 
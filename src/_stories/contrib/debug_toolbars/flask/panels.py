@@ -13,8 +13,10 @@ origin_make_context = _stories.context.make_context
 
 
 def track_context(storage):
-    def wrapper(contract, kwargs, history):
-        ctx, ns, lines, bind = origin_make_context(contract, kwargs, history)
+    def wrapper(contract, kwargs, history, validation):
+        ctx, ns, lines, bind = origin_make_context(
+            contract, kwargs, history, validation
+        )
         storage.append(ctx)
         return ctx, ns, lines, bind
 
@@ -8,6 +8,8 @@ from _pytest.config import hookimpl
 import _stories.compat
 import _stories.context
 import _stories.mounted
+from _stories.analyze import analyze
+from _stories.mounted import make_steps_key
 
 
 # FIXME: Test me.
@@ -16,15 +18,23 @@ import _stories.mounted
 origin_make_context = _stories.context.make_context
 
 
-def track_context(storage):
-    def wrapper(contract, kwargs, history):
-        ctx, ns, lines, bind = origin_make_context(contract, kwargs, history)
+def track_context(storage, stories):
+    def wrapper(contract, kwargs, history, validation):
+        ctx, ns, lines, bind = origin_make_context(
+            contract, kwargs, history, validation
+        )
         storage.append((get_test_source(*get_test_call()), history, ns, lines))
+        stories.append(get_called_story())
         return ctx, ns, lines, bind
 
     return wrapper
 
 
+def get_called_story():
+    # Context is made by the `__call__` or `run` method of the story.
+    return sys._getframe(2).f_locals.get("self")
+
+
 def get_test_call():
     f = sys._getframe()
 
@@ -60,12 +70,24 @@ def get_test_source(filename, lineno):
     return src
 
 
+def pytest_addoption(parser):
+    group = parser.getgroup("stories")
+    group.addoption(
+        "--stories-analyze",
+        action="store_true",
+        default=False,
+        help="Analyze context variables assigned by stories called in tests.",
+    )
+
+
 @hookimpl(hookwrapper=True)
 def pytest_runtest_call(item):
-    storage = []
-    _stories.mounted.make_context = track_context(storage)
+    storage, stories = [], []
+    _stories.mounted.make_context = track_context(storage, stories)
     yield
     _stories.mounted.make_context = origin_make_context
+    if item.config.getoption("stories_analyze"):
+        analyze_stories(stories)
     for i, (src, history, ns, lines) in enumerate(storage, 1):
         output = "\n\n".join(
             [
@@ -78,3 +100,33 @@ def pytest_runtest_call(item):
             ]
         )
         item.add_report_section("call", "story #%d" % (i,), output)
+
+
+# Analysis.
+
+
+reports = {}
+
+
+def analyze_stories(stories):
+    for story in stories:
+        if type(story) is not _stories.mounted.MountedStory:
+            continue
+        key = (story.plan, make_steps_key(story.callables))
+        if key not in reports:
+            reports[key] = analyze(story)
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if not config.getoption("stories_analyze"):
+        return
+    terminalreporter.write_sep("=", "stories analysis")
+    for report in reports.values():
+        terminalreporter.write_line(repr(report))
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if not session.config.getoption("stories_analyze"):
+        return
+    if exitstatus == 0 and any(report.errors for report in reports.values()):
+        session.exitstatus = 1
@@ -14,8 +14,10 @@ origin_make_context = _stories.context.make_context
 
 @libraryhook("stories")
 def track_context():
-    def wrapper(contract, kwargs, history):
-        ctx, ns, lines, bind = origin_make_context(contract, kwargs, history)
+    def wrapper(contract, kwargs, history, validation):
+        ctx, ns, lines, bind = origin_make_context(
+            contract, kwargs, history, validation
+        )
         record(
             processor=lambda data: data.update(
                 {"category": "story", "message": repr(ctx)}  # FIXME: Use pretty print.
@@ -14,12 +14,24 @@ class FailureError(StoryError):
 
 
 def make_failure_error(reason):
-    reason_representation = repr(reason) if reason else ""
+    error = failure_error_class()
+    error.reason = reason
+    return error
 
-    def repr_method(self):
-        return "FailureError(" + reason_representation + ")"
 
-    return type("FailureError", (FailureError,), {"__repr__": repr_method})()
+def failure_error_repr_method(self):
+    return "FailureError(" + (repr(self.reason) if self.reason else "") + ")"
+
+
+# Raised by the story call.  Its name is the same as the public class
+# name to show it in tracebacks the same way.
+
+
+failure_error_class = type(
+    "FailureError",
+    (FailureError,),
+    {"__slots__": ("reason",), "__repr__": failure_error_repr_method},
+)
 
 
 class FailureProtocolError(StoryError):
@@ -32,3 +44,40 @@ class ContextContractError(StoryError):
 
 class MutationError(StoryError):
     pass
+
+
+# Messages.
+
+
+class Message(object):
+    # Errors raised during the story call carry the template and its
+    # fields.  The text is rendered on the first read.
+
+    def __init__(self, template, **fields):
+        self.template = template
+        self.fields = fields
+        self.text = None
+
+    def __str__(self):
+        if self.text is None:
+            self.text = self.template.format(**self.fields)
+        return self.text
+
+    def __repr__(self):
+        return repr(str(self))
+
+    def __reduce__(self):
+        # Fields could hold contracts and validators.  Pickled error
+        # carries the rendered text.
+        return str, (str(self),)
+
+
+class Deferred(object):
+    # Message field computed when the message is rendered.
+
+    def __init__(self, func, *args):
+        self.func = func
+        self.args = args
+
+    def __str__(self):
+        return self.func(*self.args)
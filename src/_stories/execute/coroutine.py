@@ -7,21 +7,16 @@ from _stories.returned import Skip
 from _stories.returned import Success
 
 
-async def execute(runner, ctx, ns, bind, history, methods):
+async def execute(runner, ctx, ns, bind, history, methods, ends):
     __tracebackhide__ = True
 
-    skipped = 0
+    index, length = 0, len(methods)
 
-    for method, contract, protocol in methods:
+    while index < length:
 
+        method, contract, protocol = methods[index]
         method_type = type(method)
-
-        if skipped > 0:
-            if method_type is EndOfStory:
-                skipped -= 1
-            elif method_type is BeginningOfStory:
-                skipped += 1
-            continue
+        index += 1
 
         if method_type is BeginningOfStory:
             history.on_substory_start(method.story_name)
@@ -64,7 +59,7 @@ async def execute(runner, ctx, ns, bind, history, methods):
 
         if restype is Skip:
             history.on_skip()
-            skipped = 1
+            index = ends[index - 1] + 1
             continue
 
     return runner.finished()
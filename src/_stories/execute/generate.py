@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+import linecache
+from itertools import count
+
+from _stories.failures import NullExecProtocol
+from _stories.marker import BeginningOfStory
+from _stories.marker import EndOfStory
+from _stories.returned import Failure
+from _stories.returned import Result
+from _stories.returned import Skip
+from _stories.returned import Success
+
+
+# Stories larger than that are executed by the generic executor loop.
+max_entries = 1000
+
+
+counter = count(1)
+
+
+def generate_executor(methods, executor, cls_name, story_name, history=True):
+    # Contracts and markers become constants of the generated function.
+    # Steps and failure protocols differ for each instance, so they are
+    # looked up in `methods`.  Return `None` if the story is too long.
+    if len(methods) > max_entries:
+        return None
+
+    coroutine = executor.__module__.rsplit(".", 1)[-1] == "coroutine"
+    templates = recorded_templates if history else unrecorded_templates
+    source, namespace = generate_source(methods, coroutine, templates)
+    filename = "<story {}.{} #{}>".format(cls_name, story_name, next(counter))
+
+    try:
+        code = compile(source, filename, "exec")
+    except SyntaxError:
+        # Too many statically nested blocks in the deep composition.
+        return None
+
+    exec(code, namespace)  # nosec
+    linecache.cache[filename] = (
+        len(source),
+        None,
+        source.splitlines(True),
+        filename,
+    )
+    return namespace["execute"]
+
+
+def generate_source(methods, coroutine, templates):
+    namespace = {
+        "Failure": Failure,
+        "Result": Result,
+        "Skip": Skip,
+        "Success": Success,
+    }
+    lines = [
+        "{}def execute(runner, ctx, ns, bind, history, methods, ends):".format(
+            "async " if coroutine else ""
+        ),
+        "    __tracebackhide__ = True",
+    ]
+    call = "await method(ctx)" if coroutine else "method(ctx)"
+    indent = 1
+
+    for index, (method, contract, protocol) in enumerate(methods):
+
+        contract_name = "contract_%d" % index
+        namespace[contract_name] = contract
+        method_type = type(method)
+
+        if method_type is BeginningOfStory:
+            story_name = "story_name_%d" % index
+            namespace[story_name] = method.story_name
+            emit(lines, indent, templates["start"].format(story_name=story_name))
+            if contract.arguments:
+                emit(lines, indent, templates["call"].format(contract=contract_name))
+            emit(lines, indent, "while True:")
+            indent += 1
+            continue
+
+        if method_type is EndOfStory:
+            emit(lines, indent, templates["end"])
+            indent -= 1
+            continue
+
+        if type(protocol) is NullExecProtocol:
+            failure = templates["null_failure"].format(index=index)
+        else:
+            failure = templates["failure"].format(index=index)
+        emit(
+            lines,
+            indent,
+            templates["step"].format(
+                index=index, contract=contract_name, call=call, failure=failure
+            ),
+        )
+
+    emit(lines, indent, "return runner.finished()")
+    return "\n".join(lines) + "\n", namespace
+
+
+def emit(lines, indent, code):
+    lines.extend("    " * indent + line for line in code.splitlines())
+
+
+# Templates.
+
+
+failure_template = """
+        try:
+            methods[{index}][2].check_return_statement(method, result.reason)
+        except Exception as error:
+            history.on_error(error.__class__.__name__)
+            raise
+""".strip("\n")
+
+
+# Failure without reason is always allowed without failure protocol.
+
+
+null_failure_template = """
+        if result.reason:
+            try:
+                methods[{index}][2].check_return_statement(method, result.reason)
+            except Exception as error:
+                history.on_error(error.__class__.__name__)
+                raise
+""".strip("\n")
+
+
+# Substory without arguments could not miss them.
+
+
+substory_call_template = """
+try:
+    {contract}.check_substory_call(ctx, ns)
+except Exception as error:
+    history.on_error(error.__class__.__name__)
+    raise
+""".strip()
+
+
+substory_start_template = """
+history.on_substory_start({story_name})
+""".strip()
+
+
+substory_end_template = """
+history.on_substory_end()
+break
+""".strip()
+
+
+step_template = """
+method = methods[{index}][0]
+history.before_call(method.__name__)
+bind({contract}, method)
+try:
+    result = {call}
+except Exception as error:
+    history.on_error(error.__class__.__name__)
+    raise
+restype = type(result)
+if restype is not Success:
+    if restype is Failure:
+{failure}
+        history.on_failure(result.reason)
+        return runner.got_failure(ctx, method.__name__, result.reason)
+    if restype is Result:
+        history.on_result(result.value)
+        return runner.got_result(result.value)
+    if restype is not Skip:
+        raise AssertionError
+    history.on_skip()
+    break
+""".strip()
+
+
+# Templates of the executor without history.
+
+
+unrecorded_failure_template = """
+        methods[{index}][2].check_return_statement(method, result.reason)
+""".strip("\n")
+
+
+unrecorded_null_failure_template = """
+        if result.reason:
+            methods[{index}][2].check_return_statement(method, result.reason)
+""".strip("\n")
+
+
+unrecorded_substory_call_template = """
+{contract}.check_substory_call(ctx, ns)
+""".strip()
+
+
+unrecorded_step_template = """
+method = methods[{index}][0]
+bind({contract}, method)
+result = {call}
+restype = type(result)
+if restype is not Success:
+    if restype is Failure:
+{failure}
+        return runner.got_failure(ctx, method.__name__, result.reason)
+    if restype is Result:
+        return runner.got_result(result.value)
+    if restype is not Skip:
+        raise AssertionError
+    break
+""".strip()
+
+
+recorded_templates = {
+    "start": substory_start_template,
+    "call": substory_call_template,
+    "end": substory_end_template,
+    "step": step_template,
+    "failure": failure_template,
+    "null_failure": null_failure_template,
+}
+
+
+unrecorded_templates = {
+    "start": "",
+    "call": unrecorded_substory_call_template,
+    "end": "break",
+    "step": unrecorded_step_template,
+    "failure": unrecorded_failure_template,
+    "null_failure": unrecorded_null_failure_template,
+}
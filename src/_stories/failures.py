@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 from _stories.compat import Enum
 from _stories.compat import EnumMeta
+from _stories.exceptions import Deferred
 from _stories.exceptions import FailureProtocolError
+from _stories.exceptions import Message
 
 
 # Data type.
@@ -29,39 +31,78 @@ def failures_representation(failures):
         return "None"
 
 
-def collection_contains(reason, failures):
-    return reason in failures
+def collection_contains(reason, index):
+    try:
+        return reason in index
+    except TypeError:
+        # Unhashable reason could not be a string.
+        return False
 
 
 def collection_compare(a, b):
     return a == b
 
 
-def enumeration_contains(reason, failures):
-    return isinstance(reason, Enum) and reason.name in failures.__members__
+def enumeration_contains(reason, index):
+    return isinstance(reason, Enum) and reason.name in index
 
 
 def enumeration_compare(a, b):
     return a.name == b.name
 
 
+# Index.
+
+
+def failures_key(failures):
+    if isinstance(failures, EnumMeta):
+        return failures
+    else:
+        return tuple(failures)
+
+
+def make_index(failures):
+    # Reasons allowed by the protocol.  Built once for equal protocols.
+    key = failures_key(failures)
+    index = indexes.get(key)
+    if index is None:
+        if isinstance(failures, EnumMeta):
+            index = frozenset(failures.__members__)
+        else:
+            index = frozenset(failures)
+        index = indexes.setdefault(key, index)
+    return index
+
+
+indexes = {}
+
+
 # Execute.
 
 
 def make_exec_protocol(failures):
 
-    if isinstance(failures, EnumMeta):
-        return NotNullExecProtocol(failures, enumeration_contains)
-    elif isinstance(failures, (list, tuple, set, frozenset)):
-        return NotNullExecProtocol(failures, collection_contains)
-    elif failures is None:
+    if failures is None:
         return NullExecProtocol()
+    key = failures_key(failures)
+    protocol = exec_protocols.get(key)
+    if protocol is None:
+        if isinstance(failures, EnumMeta):
+            protocol = NotNullExecProtocol(failures, enumeration_contains)
+        else:
+            protocol = NotNullExecProtocol(failures, collection_contains)
+        protocol = exec_protocols.setdefault(key, protocol)
+    return protocol
+
+
+exec_protocols = {}
 
 
 class NullExecProtocol(object):
     def check_return_statement(self, method, reason):
         if reason:
-            message = null_protocol_template.format(
+            message = Message(
+                null_protocol_template,
                 reason=reason,
                 cls=method.__self__.__class__.__name__,
                 method=method.__name__,
@@ -72,8 +113,10 @@ class NullExecProtocol(object):
 class DisabledNullExecProtocol(NullExecProtocol):
     def check_return_statement(self, method, reason):
         if not reason:
-            message = disabled_null_template.format(
-                cls=method.__self__.__class__.__name__, method=method.__name__
+            message = Message(
+                disabled_null_template,
+                cls=method.__self__.__class__.__name__,
+                method=method.__name__,
             )
             raise FailureProtocolError(message)
         super(DisabledNullExecProtocol, self).check_return_statement(method, reason)
@@ -82,26 +125,36 @@ class DisabledNullExecProtocol(NullExecProtocol):
 class NotNullExecProtocol(object):
     def __init__(self, failures, contains_func):
         self.failures = failures
+        self.index = make_index(failures)
         self.contains_func = contains_func
 
     def check_return_statement(self, method, reason):
         if not reason:
-            message = null_reason_template.format(
-                available=failures_representation(self.failures),
+            message = Message(
+                null_reason_template,
+                available=Deferred(failures_representation, self.failures),
                 cls=method.__self__.__class__.__name__,
                 method=method.__name__,
             )
             raise FailureProtocolError(message)
-        if not self.contains_func(reason, self.failures):
-            message = wrong_reason_template.format(
+        if not self.contains_func(reason, self.index):
+            message = Message(
+                wrong_reason_template,
                 reason=reason,
-                available=failures_representation(self.failures),
+                available=Deferred(failures_representation, self.failures),
                 cls=method.__self__.__class__.__name__,
                 method=method.__name__,
             )
             raise FailureProtocolError(message)
 
 
+class TrustedExecProtocol(object):
+    # Reasons returned by the step were proven valid by the static
+    # analysis.
+    def check_return_statement(self, method, reason):
+        pass
+
+
 # Run.
 
 
@@ -125,8 +178,8 @@ class NullRunProtocol(object):
         self.method_name = method_name
 
     def check_failed_because_argument(self, reason):
-        message = null_summary_template.format(
-            cls=self.cls_name, method=self.method_name
+        message = Message(
+            null_summary_template, cls=self.cls_name, method=self.method_name
         )
         raise FailureProtocolError(message)
 
@@ -136,14 +189,16 @@ class NotNullRunProtocol(object):
         self.cls_name = cls_name
         self.method_name = method_name
         self.failures = failures
+        self.index = make_index(failures)
         self.contains_func = contains_func
         self.compare_func = compare_func
 
     def check_failed_because_argument(self, reason):
-        if not self.contains_func(reason, self.failures):
-            message = wrong_summary_template.format(
+        if not self.contains_func(reason, self.index):
+            message = Message(
+                wrong_summary_template,
                 reason=reason,
-                available=failures_representation(self.failures),
+                available=Deferred(failures_representation, self.failures),
                 cls=self.cls_name,
                 method=self.method_name,
             )
@@ -169,23 +224,24 @@ def combine_failures(
     elif second_failures is None:
         return first_failures
     elif isinstance(first_failures, EnumMeta) and isinstance(second_failures, EnumMeta):
-        return Enum(
-            first_failures.__name__,
-            ",".join(
-                list(first_failures.__members__.keys())
-                + [
-                    failure
-                    for failure in second_failures.__members__.keys()
-                    if failure not in first_failures.__members__.keys()
-                ]
-            ),
-        )
+        key = (first_failures, second_failures)
+        combined = combinations.get(key)
+        if combined is None:
+            combined = Enum(
+                first_failures.__name__,
+                ",".join(merge_reasons(first_failures.__members__, second_failures)),
+            )
+            combined = combinations.setdefault(key, combined)
+        return combined
     elif isinstance(first_failures, (list, tuple, set, frozenset)) and isinstance(
         second_failures, (list, tuple, set, frozenset)
     ):
-        return first_failures + [
-            failure for failure in second_failures if failure not in first_failures
-        ]
+        key = (tuple(first_failures), tuple(second_failures))
+        combined = combinations.get(key)
+        if combined is None:
+            combined = tuple(merge_reasons(first_failures, second_failures))
+            combined = combinations.setdefault(key, combined)
+        return list(combined)
     else:
         message = type_error_template.format(
             cls=first_cls_name,
@@ -198,6 +254,22 @@ def combine_failures(
         raise FailureProtocolError(message)
 
 
+def merge_reasons(first, second):
+    # Members of enumeration are iterated by their names.
+    if isinstance(second, EnumMeta):
+        second = second.__members__
+    known = set(first)
+    return list(first) + [reason for reason in second if reason not in known]
+
+
+# Composed stories are wrapped for each class they are used in.  Equal
+# combinations are built once.  Lists are interned as tuples, so each
+# composition gets its own copy.
+
+
+combinations = {}
+
+
 def maybe_disable_null_protocol(methods, reasons):
 
     if reasons is None:
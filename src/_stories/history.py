@@ -2,32 +2,109 @@
 
 
 class History(object):
+    # Events are `(kind, value)` tuples.  Text lines are rendered only
+    # when someone wants to show them.
+
+    recorded = True
+
     def __init__(self):
-        self.indent = 0
-        self.lines = []
+        self.events = []
 
     def before_call(self, method_name):
-        self.lines.append("  " * self.indent + method_name)
+        self.events.append((CALL, method_name))
 
     def on_result(self, value):
-        self.lines[-1] += " (returned: " + repr(value) + ")"
+        self.events.append((RESULT, value))
 
     def on_failure(self, reason):
-        if reason:
-            self.lines[-1] += " (failed: " + repr(reason) + ")"
-        else:
-            self.lines[-1] += " (failed)"
+        self.events.append((FAILURE, reason))
 
     def on_skip(self):
-        self.lines[-1] += " (skipped)"
-        self.indent -= 1
+        self.events.append((SKIP, None))
 
     def on_error(self, error_name):
-        self.lines[-1] += " (errored: " + error_name + ")"
+        self.events.append((ERROR, error_name))
 
     def on_substory_start(self, story_name):
-        self.before_call(story_name)
-        self.indent += 1
+        self.events.append((SUBSTORY_START, story_name))
 
     def on_substory_end(self):
-        self.indent -= 1
+        self.events.append((SUBSTORY_END, None))
+
+    @property
+    def lines(self):
+        return format_events(self.events)
+
+
+class NullHistory(object):
+    # Nothing is recorded.  The plan shares one instance between calls.
+
+    recorded = False
+
+    def __init__(self, story_name):
+        self.lines = (story_name + " (history is not recorded)",)
+
+    def before_call(self, method_name):
+        pass
+
+    def on_result(self, value):
+        pass
+
+    def on_failure(self, reason):
+        pass
+
+    def on_skip(self):
+        pass
+
+    def on_error(self, error_name):
+        pass
+
+    def on_substory_start(self, story_name):
+        pass
+
+    def on_substory_end(self):
+        pass
+
+
+# Events.
+
+
+def format_events(events):
+    lines = []
+    indent = 0
+    for kind, value in events:
+        if kind is CALL:
+            lines.append("  " * indent + value)
+        elif kind is RESULT:
+            lines[-1] += " (returned: " + repr(value) + ")"
+        elif kind is FAILURE:
+            if value:
+                lines[-1] += " (failed: " + repr(value) + ")"
+            else:
+                lines[-1] += " (failed)"
+        elif kind is SKIP:
+            lines[-1] += " (skipped)"
+            indent -= 1
+        elif kind is ERROR:
+            lines[-1] += " (errored: " + value + ")"
+        elif kind is SUBSTORY_START:
+            lines.append("  " * indent + value)
+            indent += 1
+        elif kind is SUBSTORY_END:
+            indent -= 1
+    return lines
+
+
+CALL = "call"
+
+RESULT = "result"
+
+FAILURE = "failure"
+
+SKIP = "skip"
+
+ERROR = "error"
+
+SUBSTORY_START = "substory_start"
+
+SUBSTORY_END = "substory_end"
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+from collections import OrderedDict
+
+from _stories.compat import Enum
+from _stories.settings import settings
+
+
+# Long and unicode types on Python 2.
+immutable_types = frozenset(
+    [type(None), bool, int, type(2 ** 64), float, complex, bytes, str, type(u"")]
+)
+
+
+def memo_key(value):
+    # Equal values of different types like `1`, `1.0` and `True` could
+    # be normalized differently.  Mutable values have no key.
+    cls = type(value)
+    if cls in immutable_types or isinstance(value, Enum):
+        return cls, value
+    elif cls is tuple or cls is frozenset:
+        keys = cls(map(memo_key, value))
+        if None in keys:
+            return None
+        return cls, keys
+
+
+def memoize(validator, value):
+    # Validator is stored next to its result to keep the `id` of its
+    # spec from being reused.  Mutable normalized values are not cached,
+    # otherwise every story call would share the same object.
+    key = memo_key(value)
+    if key is None:
+        return validator(value)
+    key = (validator.key, key)
+    result = cache.pop(key, None)
+    if result is not None:
+        cache[key] = result
+        counters["hits"] += 1
+        return result[1], result[2]
+    counters["misses"] += 1
+    new_value, error = validator(value)
+    if error or memo_key(new_value) is not None:
+        cache[key] = (validator, new_value, error)
+        while len(cache) > settings["memo"]:
+            cache.popitem(last=False)
+    return new_value, error
+
+
+cache = OrderedDict()
+
+
+# Instrumentation.
+
+
+counters = {"hits": 0, "misses": 0}
+
+
+def memo_counters():
+    return dict(counters)
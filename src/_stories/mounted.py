@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
+from weakref import ref
+
 from _stories.context import make_context
-from _stories.failures import make_run_protocol
-from _stories.history import History
+from _stories.context import trust_context
+from _stories.failures import TrustedExecProtocol
 from _stories.marker import BeginningOfStory
 from _stories.marker import EndOfStory
 from _stories.run import Call
@@ -9,12 +11,17 @@ from _stories.run import Run
 
 
 class ClassMountedStory(object):
-    def __init__(self, cls, name, collected, contract, failures):
+    def __init__(
+        self, cls, name, collected, contract, failures, history, validation, shallow
+    ):
         self.cls = cls
         self.name = name
         self.collected = collected
         self.contract = contract
         self.failures = failures
+        self.history = history
+        self.validation = validation
+        self.shallow = shallow
 
     def __repr__(self):
         result = [self.cls.__name__ + "." + self.name]
@@ -22,33 +29,148 @@ class ClassMountedStory(object):
         return "\n".join(result)
 
 
+# Bind.
+
+
+def bind_callables(attrs):
+    callables = []
+    for attr in attrs:
+        if type(attr) is MountedStory:
+            callables.extend(attr.callables)
+        else:
+            callables.append(attr)
+    return callables
+
+
+def bind_methods(template, slots, callables):
+    methods = list(template)
+    for index, method in zip(slots, callables):
+        _method, contract, protocol = methods[index]
+        methods[index] = (method, contract, protocol)
+    return methods
+
+
+def make_steps_key(callables):
+    # Plan is shared by instances of the class.  Instance could have
+    # different functions as its steps.
+    return tuple(getattr(method, "__func__", method) for method in callables)
+
+
+def trust_methods(methods, checked):
+    # Failure reasons of checked steps were proven valid.
+    trusted = TrustedExecProtocol()
+    return [
+        (method, contract, trusted if index in checked else protocol)
+        for index, (method, contract, protocol) in enumerate(methods)
+    ]
+
+
+# Cache.
+
+
+def get_mounted(cache, obj, plans, cls, attrs):
+    # Mounted story is reused while someone holds it and its steps are
+    # the same objects.  Plan is reused while steps are the same
+    # functions.  Equal instances never share the entry.
+    entry = cache.get(id(obj))
+    if entry is not None and entry[0]() is obj:
+        _ref, cached_plans, cached_cls, cached_key, plan, mounted_ref = entry
+        if cached_plans is plans and cached_cls is cls:
+            mounted = mounted_ref()
+            if mounted is not None and is_same_attrs(mounted.attrs, attrs):
+                return mounted, plan, cached_key
+            key = make_attrs_key(obj, attrs)
+            if key is not None and key == cached_key:
+                return None, plan, key
+            return None, None, key
+    return None, None, make_attrs_key(obj, attrs)
+
+
+def set_mounted(cache, obj, plans, cls, key, plan, mounted):
+    # Entry holds the instance weakly.  It is removed together with the
+    # instance, so the instance is still freed by reference counting.
+    if key is None:
+        return
+    ident = id(obj)
+    entry = cache.get(ident)
+    if entry is not None and entry[0]() is obj:
+        obj_ref = entry[0]
+    else:
+        try:
+            obj_ref = ref(obj, lambda _ref: cache.pop(ident, None))
+        except TypeError:
+            # Instance without weak references could not hold the cache.
+            return
+    cache[ident] = (obj_ref, plans, cls, key, plan, ref(mounted))
+
+
+def is_same_attrs(cached, attrs):
+    return all(
+        cached_attr is attr
+        or (
+            getattr(cached_attr, "__self__", None) is getattr(attr, "__self__", 1)
+            and getattr(cached_attr, "__func__", None) is getattr(attr, "__func__", 1)
+        )
+        for cached_attr, attr in zip(cached, attrs)
+    )
+
+
+def make_attrs_key(obj, attrs):
+    # Shape of the plan depends on functions of the steps and plans of
+    # the substories.  Other callables could hold the instance, so
+    # stories using them do not cache the plan.
+    key = []
+    for attr in attrs:
+        if type(attr) is MountedStory:
+            key.append(attr.plan)
+        elif getattr(attr, "__self__", None) is obj:
+            key.append(attr.__func__)
+        else:
+            return None
+    return tuple(key)
+
+
 class MountedStory(object):
-    def __init__(
-        self, obj, cls_name, name, arguments, methods, contract, failures, executor
-    ):
+    def __init__(self, obj, plan, attrs):
         self.obj = obj
-        self.cls_name = cls_name
-        self.name = name
-        self.arguments = arguments
-        self.methods = methods
-        self.contract = contract
-        self.failures = failures
-        self.executor = executor
+        self.plan = plan
+        self.cls_name = plan.cls_name
+        self.name = plan.name
+        self.arguments = plan.arguments
+        self.contract = plan.contract
+        self.failures = plan.failures
+        self.executor = plan.executor
+        self.attrs = attrs
+        self.callables = bind_callables(attrs)
+        self.methods = bind_methods(plan.methods, plan.slots, self.callables)
+        self.trusted = None
+        if plan.trusted:
+            trusted = plan.trusted.get(make_steps_key(self.callables))
+            if trusted is not None:
+                self.trusted, checked = trusted
+                self.methods = trust_methods(self.methods, checked)
 
     def __call__(self, **kwargs):
         __tracebackhide__ = True
-        history = History()
-        ctx, ns, lines, bind = make_context(self.methods[0][1], kwargs, history)
+        history, execute, validation = self.plan.start()
+        ctx, ns, lines, bind = make_context(
+            self.methods[0][1], kwargs, history, validation
+        )
+        if self.trusted is not None and self.trusted.isdisjoint(kwargs):
+            trust_context(ctx)
         runner = Call()
-        return self.executor(runner, ctx, ns, bind, history, self.methods)
+        return execute(runner, ctx, ns, bind, history, self.methods, self.plan.ends)
 
     def run(self, **kwargs):
         __tracebackhide__ = True
-        history = History()
-        ctx, ns, lines, bind = make_context(self.methods[0][1], kwargs, history)
-        run_protocol = make_run_protocol(self.failures, self.cls_name, self.name)
-        runner = Run(run_protocol)
-        return self.executor(runner, ctx, ns, bind, history, self.methods)
+        history, execute, validation = self.plan.start()
+        ctx, ns, lines, bind = make_context(
+            self.methods[0][1], kwargs, history, validation
+        )
+        if self.trusted is not None and self.trusted.isdisjoint(kwargs):
+            trust_context(ctx)
+        runner = Run(self.plan.run_protocol)
+        return execute(runner, ctx, ns, bind, history, self.methods, self.plan.ends)
 
     def __repr__(self):
         result = []
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+from random import random
+
+from _stories.exceptions import StoryDefinitionError
+
+
+# Levels.
+
+
+class Sampled(object):
+    def __init__(self, rate):
+        if not 0 <= rate <= 1:
+            message = wrong_rate_template.format(rate=rate)
+            raise StoryDefinitionError(message)
+        self.rate = rate
+
+    def __repr__(self):
+        return "sampled(" + repr(self.rate) + ")"
+
+
+def sampled(rate):
+    return Sampled(rate)
+
+
+def check_level(name, level, levels):
+    if level in levels or type(level) is Sampled:
+        return
+    message = wrong_level_template.format(
+        name=name, level=level, available=", ".join(map(repr, levels))
+    )
+    raise StoryDefinitionError(message)
+
+
+def is_enabled(level):
+    if level == "full":
+        return True
+    elif level == "off":
+        return False
+    else:
+        return random() < level.rate  # nosec
+
+
+# Settings.
+
+
+history_levels = ("full", "off")
+
+
+container_levels = ("full", "shallow")
+
+
+validation_levels = ("full", "arguments", "off")
+
+
+settings = {"history": "full", "containers": "full", "validation": "full", "memo": 0}
+
+
+def configure(history=None, containers=None, validation=None, memo=None):
+    if history is not None:
+        check_level("history", history, history_levels)
+        settings["history"] = history
+    if containers is not None:
+        check_level("containers", containers, container_levels)
+        settings["containers"] = containers
+    if validation is not None:
+        check_level("validation", validation, validation_levels)
+        settings["validation"] = validation
+    if memo is not None:
+        check_memo_size(memo)
+        settings["memo"] = memo
+
+
+def check_memo_size(size):
+    if type(size) is int and size >= 0:
+        return
+    message = wrong_memo_template.format(size=size)
+    raise StoryDefinitionError(message)
+
+
+def get_history_level(level):
+    return settings["history"] if level is None else level
+
+
+def get_validation_level(level):
+    # Calls which were not sampled validate story arguments only.
+    level = settings["validation"] if level is None else level
+    if type(level) is Sampled:
+        level = "full" if is_enabled(level) else "arguments"
+    validations[level] += 1
+    return level
+
+
+# Instrumentation.
+
+
+validations = {"full": 0, "arguments": 0, "off": 0}
+
+
+def validation_counters():
+    return dict(validations)
+
+
+# Messages.
+
+
+wrong_rate_template = """
+Sampling rate should be a number between 0 and 1: {rate!r}
+""".strip()
+
+
+wrong_level_template = """
+Unexpected {name} level: {level!r}
+
+Available levels are: {available}, sampled(rate)
+""".strip()
+
+
+wrong_memo_template = """
+Memo cache size should be a non-negative integer: {size!r}
+""".strip()
@@ -1,9 +1,17 @@
 # -*- coding: utf-8 -*-
+from weakref import WeakKeyDictionary
+
 from _stories.argument import get_arguments
 from _stories.collect import collect_story
+from _stories.contract import check_shallow_fields
 from _stories.failures import check_data_type
 from _stories.mounted import ClassMountedStory
+from _stories.mounted import get_mounted
 from _stories.mounted import MountedStory
+from _stories.mounted import set_mounted
+from _stories.settings import check_level
+from _stories.settings import history_levels
+from _stories.settings import validation_levels
 from _stories.wrap import wrap_story
 
 
@@ -12,44 +20,83 @@ def story(f):
     arguments = get_arguments(f)
     collected = collect_story(f)
     # Can't use non local keyword because of Python 2.
-    this = {"contract": None, "failures": None}
+    this = {
+        "contract": None,
+        "failures": None,
+        "history": None,
+        "validation": None,
+        "shallow": (),
+        "plans": WeakKeyDictionary(),
+        "mounted": {},
+    }
 
     def contract_method(contract):
         # FIXME: Raise error on unsupported types.
         this["contract"] = contract
+        this["plans"] = WeakKeyDictionary()
         return contract
 
     def failures_method(failures):
         check_data_type(failures)
         this["failures"] = failures
+        this["plans"] = WeakKeyDictionary()
         return failures
 
+    def history_method(level):
+        check_level("history", level, history_levels)
+        this["history"] = level
+        this["plans"] = WeakKeyDictionary()
+        return level
+
+    def validation_method(level):
+        check_level("validation", level, validation_levels)
+        this["validation"] = level
+        this["plans"] = WeakKeyDictionary()
+        return level
+
+    def shallow_method(*fields):
+        check_shallow_fields(fields)
+        this["shallow"] = fields
+        this["plans"] = WeakKeyDictionary()
+        return fields
+
     def get_method(self, obj, cls):
         __tracebackhide__ = True
         if obj is None:
             return ClassMountedStory(
-                cls, name, collected, contract_method, failures_method
-            )
-        else:
-            methods, contract, failures, executor = wrap_story(
-                arguments,
-                collected,
-                cls.__name__,
-                name,
-                obj,
-                this["contract"],
-                this["failures"],
-            )
-            return MountedStory(
-                obj,
-                cls.__name__,
+                cls,
                 name,
-                arguments,
-                methods,
-                contract,
-                failures,
-                executor,
+                collected,
+                contract_method,
+                failures_method,
+                history_method,
+                validation_method,
+                shallow_method,
             )
+        else:
+            attrs = [getattr(obj, attr) for attr in collected]
+            cache = this["mounted"]
+            mounted, plan, key = get_mounted(cache, obj, this["plans"], cls, attrs)
+            if mounted is not None:
+                return mounted
+
+            if plan is None:
+                plan = wrap_story(
+                    this["plans"],
+                    arguments,
+                    collected,
+                    cls,
+                    name,
+                    attrs,
+                    this["contract"],
+                    this["failures"],
+                    this["history"],
+                    this["validation"],
+                    this["shallow"],
+                )
+            mounted = MountedStory(obj, plan, attrs)
+            set_mounted(cache, obj, this["plans"], cls, key, plan, mounted)
+            return mounted
 
     return type(
         "Story",
@@ -58,5 +105,8 @@ def story(f):
             "__get__": get_method,
             "contract": staticmethod(contract_method),
             "failures": staticmethod(failures_method),
+            "history": staticmethod(history_method),
+            "validation": staticmethod(validation_method),
+            "shallow": staticmethod(shallow_method),
         },
     )()
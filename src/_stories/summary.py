@@ -1,60 +1,51 @@
 # -*- coding: utf-8 -*-
 
 
-def make_failure_summary(protocol, ctx, failed_method, failure_reason):
-    def failed_on_method(self, method_name):
-        return method_name == failed_method
+class FailureSummary(object):
+    __slots__ = ("protocol", "ctx", "failed_method", "failure_reason")
 
-    def failed_because_method(self, reason):
-        protocol.check_failed_because_argument(reason)
-        return protocol.compare_failed_because_argument(reason, failure_reason)
+    is_success = False
+    is_failure = True
 
-    return type(
-        "FailureSummary",
-        (object,),
-        {
-            "is_success": False,
-            "is_failure": True,
-            "ctx": ctx,
-            "value": failure_value_method,
-            "failed_on": failed_on_method,
-            "failed_because": failed_because_method,
-            "__repr__": failure_repr_method,
-        },
-    )()
+    def __init__(self, protocol, ctx, failed_method, failure_reason):
+        self.protocol = protocol
+        self.ctx = ctx
+        self.failed_method = failed_method
+        self.failure_reason = failure_reason
 
+    @property
+    def value(self):
+        raise AssertionError
 
-@property
-def failure_value_method(self):
-    raise AssertionError
+    def failed_on(self, method_name):
+        return method_name == self.failed_method
 
+    def failed_because(self, reason):
+        self.protocol.check_failed_because_argument(reason)
+        return self.protocol.compare_failed_because_argument(
+            reason, self.failure_reason
+        )
 
-def failure_repr_method(self):
-    return "Failure()"
+    def __repr__(self):
+        return "Failure()"
 
 
-def make_success_summary(protocol, value):
-    def success_failed_because_method(self, reason):
-        protocol.check_failed_because_argument(reason)
-        return False
+class SuccessSummary(object):
+    __slots__ = ("protocol", "value")
 
-    return type(
-        "SuccessSummary",
-        (object,),
-        {
-            "is_success": True,
-            "is_failure": False,
-            "value": value,
-            "failed_on": success_failed_on_method,
-            "failed_because": success_failed_because_method,
-            "__repr__": success_repr_method,
-        },
-    )()
+    is_success = True
+    is_failure = False
 
+    def __init__(self, protocol, value):
+        self.protocol = protocol
+        self.value = value
 
-def success_failed_on_method(self, method_name):
-    return False
+    def failed_on(self, method_name):
+        return False
 
+    def failed_because(self, reason):
+        self.protocol.check_failed_because_argument(reason)
+        return False
 
-def success_repr_method(self):
-    return "Success()"
+    def __repr__(self):
+        return "Success()"
@@ -4,30 +4,67 @@ from _stories.contract import make_contract
 from _stories.contract import maybe_extend_downstream_argsets
 from _stories.exceptions import StoryDefinitionError
 from _stories.execute import get_executor
+from _stories.execute.generate import generate_executor
 from _stories.failures import combine_failures
 from _stories.failures import make_exec_protocol
+from _stories.failures import make_run_protocol
 from _stories.failures import maybe_disable_null_protocol
+from _stories.history import History
+from _stories.history import NullHistory
 from _stories.marker import BeginningOfStory
 from _stories.marker import EndOfStory
 from _stories.mounted import MountedStory
+from _stories.settings import get_history_level
+from _stories.settings import get_validation_level
+from _stories.settings import is_enabled
+
+
+def wrap_story(
+    plans,
+    arguments,
+    collected,
+    cls,
+    story_name,
+    attrs,
+    spec,
+    failures,
+    history,
+    validation,
+    shallow,
+):
+    __tracebackhide__ = True
+    executor, shape = make_shape(cls.__name__, story_name, attrs)
+    compiled = plans.setdefault(cls, {})
+    plan = compiled.get(shape)
+    if plan is None:
+        plan = StoryPlan(
+            cls.__name__,
+            story_name,
+            arguments,
+            collected,
+            spec,
+            failures,
+            history,
+            validation,
+            shallow,
+            shape,
+            executor,
+        )
+        compiled[shape] = plan
+    return plan
 
 
-def wrap_story(arguments, collected, cls_name, story_name, obj, spec, failures):
+def make_shape(cls_name, story_name, attrs):
     __tracebackhide__ = True
 
     executor = None
-    contract = make_contract(cls_name, story_name, arguments, spec)
-    protocol = make_exec_protocol(failures)
-
-    methods = [(BeginningOfStory(cls_name, story_name), contract, protocol)]
+    shape = []
 
-    for name in collected:
-
-        attr = getattr(obj, name)
+    for attr in attrs:
 
         if type(attr) is not MountedStory:
             executor = get_executor(attr, executor, cls_name, story_name)
-            methods.append((attr, contract, protocol))
+            shape.append(executor)
             continue
 
         if executor is not None and executor is not attr.executor:
@@ -43,24 +80,137 @@ def wrap_story(arguments, collected, cls_name, story_name, obj, spec, failures):
         elif executor is None:
             executor = attr.executor
 
-        combine_contract(contract, attr.contract)
+        shape.append(attr.plan)
+
+    return executor, tuple(shape)
+
+
+class StoryPlan(object):
+    # Story compiled for the class.  Steps are `None` placeholders at
+    # the `slots` positions filled by the mounted story.
+
+    def __init__(
+        self,
+        cls_name,
+        name,
+        arguments,
+        collected,
+        spec,
+        failures,
+        history,
+        validation,
+        shallow,
+        shape,
+        executor,
+    ):
+        self.cls_name = cls_name
+        self.name = name
+        self.arguments = arguments
+        self.collected = collected
+        self.spec = spec
+        self.declared_failures = failures
+        self.history = history
+        self.validation = validation
+        self.shallow = shallow
+        self.null_history = NullHistory(cls_name + "." + name)
+        self.shape = shape
+        self.executor = executor
+        self.methods, self.contract, self.failures = self.compile_methods()
+        self.run_protocol = make_run_protocol(self.failures, cls_name, name)
+        contracts = {
+            id(contract): contract for _method, contract, _protocol in self.methods
+        }
+        for contract in contracts.values():
+            contract.make_variables()
+        self.slots = tuple(
+            index
+            for index, (method, _contract, _protocol) in enumerate(self.methods)
+            if method is None
+        )
+        self.ends = make_ends(self.methods)
+        self.execute = (
+            generate_executor(self.methods, executor, cls_name, name) or executor
+        )
+        self.execute_unrecorded = None
+        # Steps of instances proven safe by the static analysis mapped
+        # to the arguments they assign and indexes of steps with proven
+        # failure reasons.
+        self.trusted = {}
+
+    def start(self):
+        # History, executor and validation of the next story call.
+        validation = get_validation_level(self.validation)
+        if is_enabled(get_history_level(self.history)):
+            return History(), self.execute, validation
+        execute = self.execute_unrecorded
+        if execute is None:
+            execute = self.execute_unrecorded = (
+                generate_executor(
+                    self.methods, self.executor, self.cls_name, self.name, False
+                )
+                or self.executor
+            )
+        return self.null_history, execute, validation
 
-        failures = combine_failures(
-            failures, cls_name, story_name, attr.failures, attr.cls_name, attr.name
+    def compile_methods(self):
+        __tracebackhide__ = True
+
+        contract = make_contract(
+            self.cls_name, self.name, self.arguments, self.spec, self.shallow
         )
+        protocol = make_exec_protocol(self.declared_failures)
+        failures = self.declared_failures
+
+        methods = [(BeginningOfStory(self.cls_name, self.name), contract, protocol)]
+
+        for name, entry in zip(self.collected, self.shape):
+
+            if type(entry) is not StoryPlan:
+                methods.append((None, contract, protocol))
+                continue
+
+            # Substory plan could be used on its own.  We compile it
+            # one more time to not share modifications below.
+            sub_methods, sub_contract, sub_failures = entry.compile_methods()
+
+            combine_contract(contract, sub_contract)
+
+            failures = combine_failures(
+                failures,
+                self.cls_name,
+                self.name,
+                sub_failures,
+                entry.cls_name,
+                entry.name,
+            )
+
+            # FIXME: Is there a way to avoid this modification?
+            sub_methods[0][0].set_parent(name)
+
+            methods.extend(sub_methods)
 
-        # FIXME: Is there a way to avoid this modification?
-        attr.methods[0][0].set_parent(name)
+        methods.append((EndOfStory(), contract, protocol))
 
-        methods.extend(attr.methods)
+        maybe_extend_downstream_argsets(methods, contract)
 
-    methods.append((EndOfStory(), contract, protocol))
+        methods = maybe_disable_null_protocol(methods, failures)
 
-    maybe_extend_downstream_argsets(methods, contract)
+        return tuple(methods), contract, failures
 
-    methods = maybe_disable_null_protocol(methods, failures)
 
-    return methods, contract, failures, executor
+def make_ends(methods):
+    # Index of the substory end for its beginning marker and for each
+    # step of this substory.  Executor jumps there on `Skip` result.
+    ends, stack = [None] * len(methods), []
+    for index in reversed(range(len(methods))):
+        method_type = type(methods[index][0])
+        if method_type is EndOfStory:
+            stack.append(index)
+        elif method_type is BeginningOfStory:
+            ends[index] = stack.pop()
+        else:
+            ends[index] = stack[-1]
+    return tuple(ends)
 
 
 # Messages.
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+"""
+stories.analyze
+---------------
+
+This module contains static analysis of context variables assigned by
+story steps.
+
+Run it with `python -m stories.analyze module[:Class] ...`.
+
+:copyright: (c) 2018-2020 Artem Malyshev.
+:license: BSD, see LICENSE for more details.
+"""
+import sys
+
+from _stories.analyze import analyze
+from _stories.analyze import main
+from _stories.analyze import trust
+
+
+__all__ = ["analyze", "main", "trust"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,7 +8,15 @@ This module contains integration with PyTest framework.
 :copyright: (c) 2018-2020 Artem Malyshev.
 :license: BSD, see LICENSE for more details.
 """
+from _stories.contrib.pytest import pytest_addoption
 from _stories.contrib.pytest import pytest_runtest_call
+from _stories.contrib.pytest import pytest_sessionfinish
+from _stories.contrib.pytest import pytest_terminal_summary
 
 
-__all__ = ["pytest_runtest_call"]
+__all__ = [
+    "pytest_addoption",
+    "pytest_runtest_call",
+    "pytest_sessionfinish",
+    "pytest_terminal_summary",
+]
@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+"""
+stories.settings
+----------------
+
+This module contains global settings of the stories execution.
+
+:copyright: (c) 2018-2020 Artem Malyshev.
+:license: BSD, see LICENSE for more details.
+"""
+from _stories.memo import memo_counters
+from _stories.settings import configure
+from _stories.settings import sampled
+from _stories.settings import validation_counters
+
+
+__all__ = ["configure", "memo_counters", "sampled", "validation_counters"]
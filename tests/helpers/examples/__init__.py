@@ -22,6 +22,10 @@ def contracts():
         yield "examples.contract.marshmallow3"
     if helpers.is_installed("cerberus"):
         yield "examples.contract.cerberus"
+    if helpers.is_installed("msgspec"):
+        yield "examples.contract.msgspec"
+    if sys.version_info >= (3, 8):
+        yield "examples.contract.annotations"
 
 
 # Fixtures.
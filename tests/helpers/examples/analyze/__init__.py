@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+from enum import Enum
+
+from stories import arguments
+from stories import story
+
+
+def integer(value):
+    if isinstance(value, int):
+        return value, None
+    else:
+        return None, "Invalid value"
+
+
+# Child base classes.
+
+
+class Child(object):
+    @story
+    @arguments("foo")
+    def x(I):
+        I.one
+        I.two
+
+    x.contract({"foo": integer, "bar": integer, "baz": integer})
+
+
+class ChildWithNull(object):
+    @story
+    @arguments("foo")
+    def x(I):
+        I.one
+        I.two
+
+
+class ChildWithList(object):
+    @story
+    @arguments("foo")
+    def x(I):
+        I.one
+        I.two
+
+    x.contract({"foo": integer, "bar": integer, "baz": integer})
+    x.failures(["foo", "bar"])
+
+
+class ChildWithEnum(object):
+    @story
+    @arguments("foo")
+    def x(I):
+        I.one
+        I.two
+
+    x.contract({"foo": integer, "bar": integer, "baz": integer})
+
+    @x.failures
+    class Errors(Enum):
+        foo = 1
+        bar = 2
+
+
+# Parent base classes.
+
+
+class Parent(object):
+    @story
+    @arguments("ham")
+    def a(I):
+        I.before
+        I.x
+        I.after
+
+    a.contract({"ham": integer, "eggs": integer})
+
+
+class ParentWithList(object):
+    @story
+    @arguments("ham")
+    def a(I):
+        I.before
+        I.x
+        I.after
+
+    a.contract({"ham": integer, "eggs": integer})
+    a.failures(["foo", "bar"])
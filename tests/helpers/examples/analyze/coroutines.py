@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+from functools import wraps
+
+from examples.analyze import Child
+from examples.analyze import ChildWithEnum
+from examples.analyze import ChildWithList
+from examples.analyze import ChildWithNull
+from examples.analyze import Parent
+from examples.analyze import ParentWithList
+from stories import Failure
+from stories import Success
+
+# Decorators.
+
+
+def override(step):
+    @wraps(step)
+    async def wrapper(self, ctx):
+        ctx.foo = "overridden"
+        return await step(self, ctx)
+
+    return wrapper
+
+
+def reject(step):
+    @wraps(step)
+    async def wrapper(self, ctx):
+        if ctx.foo > 1:
+            return Failure("not-declared")
+        return await step(self, ctx)
+
+    return wrapper
+
+
+# Mixins.
+
+
+class SafeMethod(object):
+    async def one(self, ctx):
+        if ctx.foo > 1:
+            ctx.bar = 1
+        else:
+            ctx.bar = 2
+        return Success()
+
+    async def two(self, ctx):
+        ctx.baz = ctx.bar + 1
+        return Success()
+
+
+class UnknownMethod(SafeMethod):
+    async def two(self, ctx):
+        ctx.spam = 1
+        return Success()
+
+
+class OverrideMethod(SafeMethod):
+    async def two(self, ctx):
+        ctx.bar = 3
+        ctx.foo = 4
+        return Success()
+
+
+class LoopMethod(SafeMethod):
+    async def two(self, ctx):
+        for baz in range(ctx.foo):
+            ctx.baz = baz
+        return Success()
+
+
+class EscapeMethod(SafeMethod):
+    async def two(self, ctx):
+        setattr(ctx, "baz", 1)
+        return Success()
+
+
+class DecoratedMethod(SafeMethod):
+    @override
+    async def two(self, ctx):
+        ctx.baz = ctx.bar + 1
+        return Success()
+
+
+class DunderMethod(SafeMethod):
+    async def two(self, ctx):
+        ctx.__setattr__("foo", 5)
+        return Success()
+
+
+class ReadMethod(SafeMethod):
+    async def one(self, ctx):
+        ctx.bar = ctx.baz
+        return Success()
+
+
+class NoSourceMethod(SafeMethod):
+    namespace = {"Success": Success}
+    exec("async def two(self, ctx):\n    return Success()", namespace)  # nosec
+    two = namespace["two"]
+
+
+class FailureMethod(SafeMethod):
+    async def two(self, ctx):
+        if ctx.bar > 1:
+            return Failure("foo")
+        return Success()
+
+
+class EnumFailureMethod(SafeMethod):
+    async def two(self, ctx):
+        if ctx.bar > 1:
+            return Failure(ChildWithEnum.Errors.foo)
+        return Success()
+
+
+class KeywordFailureMethod(SafeMethod):
+    async def two(self, ctx):
+        if ctx.bar > 1:
+            return Failure(reason=ChildWithEnum.Errors.foo)
+        return Success()
+
+
+class StarredFailureMethod(SafeMethod):
+    async def two(self, ctx):
+        if ctx.bar > 1:
+            return Failure(*self.reasons)
+        return Success()
+
+    reasons = ["foo"]
+
+
+class ExtraFailureMethod(SafeMethod):
+    async def two(self, ctx):
+        if ctx.bar > 1:
+            return Failure(reason="foo", other="bar")
+        return Success()
+
+
+class ItemFailureMethod(SafeMethod):
+    async def two(self, ctx):
+        if ctx.bar > 1:
+            return Failure(self.reasons[0])
+        return Success()
+
+    reasons = ["foo"]
+
+
+class WrongFailureMethod(SafeMethod):
+    async def two(self, ctx):
+        if ctx.bar > 1:
+            return Failure("spam")
+        return Success()
+
+
+class NullFailureMethod(SafeMethod):
+    async def two(self, ctx):
+        if ctx.bar > 1:
+            return Failure()
+        return Success()
+
+
+class WrappedFailureMethod(SafeMethod):
+    @reject
+    async def two(self, ctx):
+        if ctx.bar > 1:
+            return Failure("foo")
+        return Success()
+
+
+class IndirectFailureMethod(SafeMethod):
+    async def two(self, ctx):
+        return self.fail()
+
+    def fail(self):
+        return Failure("foo")
+
+
+# Parent mixins.
+
+
+class ParentMethod(object):
+    async def before(self, ctx):
+        ctx.foo = ctx.ham
+        return Success()
+
+    async def after(self, ctx):
+        ctx.eggs = ctx.baz
+        return Success()
+
+
+# Stories.
+
+
+class Safe(Child, SafeMethod):
+    pass
+
+
+class Unknown(Child, UnknownMethod):
+    pass
+
+
+class Override(Child, OverrideMethod):
+    pass
+
+
+class Loop(Child, LoopMethod):
+    pass
+
+
+class Escape(Child, EscapeMethod):
+    pass
+
+
+class Decorated(Child, DecoratedMethod):
+    pass
+
+
+class Dunder(Child, DunderMethod):
+    pass
+
+
+class Read(ChildWithNull, ReadMethod):
+    pass
+
+
+class NoSource(Child, NoSourceMethod):
+    pass
+
+
+class Composed(Parent, ParentMethod):
+    def __init__(self):
+        self.x = Safe().x
+
+
+class Injected(Child, SafeMethod):
+    def __init__(self, f):
+        self.two = f
+
+
+class ListFailure(ChildWithList, FailureMethod):
+    pass
+
+
+class EnumFailure(ChildWithEnum, EnumFailureMethod):
+    pass
+
+
+class KeywordFailure(ChildWithEnum, KeywordFailureMethod):
+    pass
+
+
+class StarredFailure(ChildWithList, StarredFailureMethod):
+    pass
+
+
+class ExtraFailure(ChildWithList, ExtraFailureMethod):
+    pass
+
+
+class ItemFailure(ChildWithList, ItemFailureMethod):
+    pass
+
+
+class WrongFailure(ChildWithList, WrongFailureMethod):
+    pass
+
+
+class NullFailure(ChildWithList, NullFailureMethod):
+    pass
+
+
+class WrappedFailure(ChildWithList, WrappedFailureMethod):
+    pass
+
+
+class IndirectFailure(ChildWithList, IndirectFailureMethod):
+    pass
+
+
+class DisabledFailure(Child, NullFailureMethod):
+    pass
+
+
+class ComposedFailure(ParentWithList, ParentMethod):
+    def __init__(self):
+        self.x = DisabledFailure().x
@@ -29,6 +29,11 @@ class CompareMethod(object):
             pass  # pragma: no cover
 
 
+class TypeMethod(object):
+    async def one(self, ctx):
+        return Result(type(ctx))
+
+
 class DirMethod(object):
     async def one(self, ctx):
         return Result(dir(ctx))
@@ -29,6 +29,11 @@ class CompareMethod(object):
             pass  # pragma: no cover
 
 
+class TypeMethod(object):
+    def one(self, ctx):
+        return Result(type(ctx))
+
+
 class DirMethod(object):
     def one(self, ctx):
         return Result(dir(ctx))
@@ -0,0 +1,429 @@
+# -*- coding: utf-8 -*-
+from typing import Any
+from typing import ClassVar
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Literal
+from typing import Optional
+from typing import Tuple
+from typing import TypeVar
+from typing import TypedDict
+from typing import Union
+
+from stories import arguments
+from stories import story
+
+
+# Constants.
+
+
+representations = {
+    "int_error": "Expected int, got str",
+    "list_of_int_error": "Expected int, got str at [0]",
+    "int_field_repr": "int",
+    "str_field_repr": "str",
+    "list_of_int_field_repr": "List[int]",
+    "list_of_str_field_repr": "List[str]",
+    "contract_class_repr": "<class 'object'>",
+}
+
+
+# Values are checked without conversion.
+
+
+normalization = False
+
+
+# Child base classes.
+
+
+class Child(object):
+    @story
+    def x(I):
+        I.one
+
+    @x.contract
+    class Contract:
+        foo: int
+        bar: List[int]
+        baz: int
+
+
+class ChildWithNull(object):
+    @story
+    def x(I):
+        I.one
+
+
+class ChildWithShrink(object):
+    @story
+    def x(I):
+        I.one
+
+    @x.contract
+    class Contract:
+        baz: int
+
+
+class ChildAlias(object):
+    @story
+    def x(I):
+        I.one
+
+    @x.contract
+    class Contract:
+        foo: Dict[str, str]
+        bar: Dict[str, str]
+        baz: Dict[str, int]
+
+
+class ParamChild(object):
+    @story
+    @arguments("foo", "bar")
+    def x(I):
+        I.one
+
+    @x.contract
+    class Contract:
+        foo: int
+        bar: List[int]
+        baz: int
+
+
+class ParamChildShallow(object):
+    @story
+    @arguments("foo", "bar")
+    def x(I):
+        I.one
+
+    @x.contract
+    class Contract:
+        foo: int
+        bar: List[int]
+        baz: int
+
+    x.shallow("bar")
+
+
+class ParamChildWithNull(object):
+    @story
+    @arguments("foo", "bar")
+    def x(I):
+        I.one
+
+
+class ParamChildWithShrink(object):
+    @story
+    @arguments("foo", "bar", "baz")
+    def x(I):
+        I.one
+
+    @x.contract
+    class Contract:
+        baz: int
+
+
+class ParamChildAlias(object):
+    @story
+    @arguments("foo", "bar", "baz")
+    def x(I):
+        I.one
+
+    @x.contract
+    class Contract:
+        foo: Dict[str, str]
+        bar: Dict[str, str]
+        baz: Dict[str, int]
+
+
+# Next child base classes.
+
+
+class NextChildWithSame(object):
+    @story
+    def y(I):
+        I.one
+
+    @y.contract
+    class Contract:
+        foo: int
+        bar: List[int]
+        baz: int
+
+
+class NextParamChildWithString(object):
+    @story
+    @arguments("foo", "bar")
+    def y(I):
+        I.two
+
+    @y.contract
+    class Contract:
+        foo: str
+        bar: List[str]
+
+
+# Parent base classes.
+
+
+class Parent(object):
+    @story
+    def a(I):
+        I.before
+        I.x
+        I.after
+
+
+@Parent.a.contract
+class Contract:
+    ham: int
+    eggs: int
+    beans: int
+
+
+class ParentWithNull(object):
+    @story
+    def a(I):
+        I.before
+        I.x
+        I.after
+
+
+class ParentWithSame(object):
+    @story
+    def a(I):
+        I.before
+        I.x
+        I.after
+
+
+@ParentWithSame.a.contract
+class Contract:  # noqa: F811
+    foo: int
+    bar: List[int]
+    baz: int
+
+
+class SequentialParent(object):
+    @story
+    def a(I):
+        I.before
+        I.x
+        I.y
+        I.after
+
+    @a.contract
+    class Contract(TypedDict):
+        pass
+
+
+class ParamParent(object):
+    @story
+    @arguments("ham", "eggs")
+    def a(I):
+        I.before
+        I.x
+        I.after
+
+
+@ParamParent.a.contract
+class Contract:  # noqa: F811
+    ham: int
+    eggs: int
+    beans: int
+
+
+class ParamParentWithNull(object):
+    @story
+    @arguments("ham", "eggs")
+    def a(I):
+        I.before
+        I.x
+        I.after
+
+
+class ParamParentWithSame(object):
+    @story
+    @arguments("foo", "bar", "baz")
+    def a(I):
+        I.before
+        I.after
+
+
+@ParamParentWithSame.a.contract
+class Contract:  # noqa: F811
+    foo: int
+    bar: List[int]
+    baz: int
+
+
+class ParamParentWithSameWithString(object):
+    @story
+    @arguments("foo", "bar")
+    def a(I):
+        I.before
+        I.x
+        I.after
+
+
+@ParamParentWithSameWithString.a.contract
+class Contract:  # noqa: F811
+    foo: str
+    bar: List[str]
+
+
+# Root base classes.
+
+
+class Root(object):
+    @story
+    def i(I):
+        I.start
+        I.a
+        I.finish
+
+
+@Root.i.contract
+class Contract:  # noqa: F811
+    fizz: int
+    buzz: int
+
+
+class RootWithSame(object):
+    @story
+    def i(I):
+        I.start
+        I.a
+        I.finish
+
+
+@RootWithSame.i.contract
+class Contract:  # noqa: F811
+    foo: int
+    bar: List[int]
+    baz: int
+
+
+class SequentialRoot(object):
+    @story
+    def i(I):
+        I.start
+        I.a
+        I.b
+        I.finish
+
+
+@SequentialRoot.i.contract
+class Contract:  # noqa: F811
+    fizz: int
+    buzz: int
+
+
+class ParamRoot(object):
+    @story
+    @arguments("fizz")
+    def i(I):
+        I.start
+        I.a
+        I.finish
+
+
+@ParamRoot.i.contract
+class Contract:  # noqa: F811
+    fizz: int
+    buzz: int
+
+
+# Typed dict base classes.
+
+
+class Point(TypedDict):
+    x: int
+    y: float
+
+
+class Segment(TypedDict, total=False):
+    start: Point
+    label: str
+
+
+Item = TypeVar("Item")
+
+
+class AnnotatedChild(object):
+    @story
+    @arguments("foo", "bar")
+    def x(I):
+        I.one
+
+    @x.contract
+    class Contract:
+        foo: int
+        bar: List[str]
+        baz: Optional[Dict[str, float]]
+        point: Point
+
+    baz = {"a": 1.5}
+    point = {"x": 1, "y": 2.0}
+
+
+class VariousChild(object):
+    @story
+    @arguments("rows", "mode", "pair", "value", "anything")
+    def x(I):
+        I.one
+
+    @x.contract
+    class Contract:
+        rows: Iterable[int]
+        mode: Literal["fast", "slow"]
+        pair: Tuple[int, str]
+        value: Union[int, List[Union[str, int]]]
+        anything: Any
+
+
+class StructureChild(object):
+    @story
+    @arguments("scores", "segment", "ratio", "number", "empty")
+    def x(I):
+        I.one
+
+    @x.contract
+    class Contract:
+        scores: Dict[str, int]
+        segment: Segment
+        ratio: float
+        number: complex
+        empty: Tuple[()]
+
+
+class ShallowChild(object):
+    @story
+    @arguments("value", "mode", "number", "item", "anything")
+    def x(I):
+        I.one
+
+    @x.contract
+    class Contract:
+        value: Union[int, List[str]]
+        mode: Literal["fast", "slow"]
+        number: complex
+        item: Item
+        anything: Any
+
+    x.shallow("value", "mode", "number", "item", "anything")
+
+
+class LimitedChild(object):
+    @story
+    @arguments("foo")
+    def x(I):
+        I.one
+
+    @x.contract
+    class Contract:
+        foo: int
+        limit: ClassVar[int] = 3
+
+    limit = 3
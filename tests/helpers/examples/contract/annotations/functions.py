@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+from examples.contract.common.functions import *  # noqa: F401, F403
+from examples.contract.annotations import *  # noqa: F401, F403
+from stories import Result
+from stories import Success
+
+
+class AnnotatedMethod(object):
+    def one(self, ctx):
+        self.bar = ctx.bar
+        ctx.baz = self.baz
+        ctx.point = self.point
+        return Success()
+
+
+class VariousMethod(object):
+    def one(self, ctx):
+        return Result(list(ctx.rows))
+
+
+class StructureMethod(object):
+    def one(self, ctx):
+        return Result(ctx.segment)
+
+
+class ShallowMethod(object):
+    def one(self, ctx):
+        return Result(ctx.value)
+
+
+class LimitedMethod(object):
+    def one(self, ctx):
+        ctx.limit = self.limit
+        return Success()
@@ -94,6 +94,25 @@ class ParamChild(object):
     )
 
 
+class ParamChildShallow(object):
+    @story
+    @arguments("foo", "bar")
+    def x(I):
+        I.one
+
+    x.contract(
+        Validator(
+            {
+                "foo": {"type": "integer", "coerce": int},
+                "bar": {"type": "list", "schema": {"type": "integer", "coerce": int}},
+                "baz": {"type": "integer", "coerce": int},
+            }
+        )
+    )
+
+    x.shallow("bar")
+
+
 class ParamChildWithNull(object):
     @story
     @arguments("foo", "bar")
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 from marshmallow import fields
 from marshmallow import Schema
+from marshmallow import validates_schema
+from marshmallow import ValidationError
 
 from stories import arguments
 from stories import story
@@ -84,6 +86,39 @@ class ParamChild(object):
         baz = fields.Integer()
 
 
+class ParamChildShallow(object):
+    @story
+    @arguments("foo", "bar")
+    def x(I):
+        I.one
+
+    @x.contract
+    class Contract(Schema):
+        foo = fields.Integer()
+        bar = fields.List(fields.Integer())
+        baz = fields.Integer()
+
+    x.shallow("bar")
+
+
+class ParamChildWithSchemaCheck(object):
+    @story
+    @arguments("foo", "bar")
+    def x(I):
+        I.one
+
+    @x.contract
+    class Contract(Schema):
+        foo = fields.Integer()
+        bar = fields.List(fields.Integer())
+        baz = fields.Integer()
+
+        @validates_schema
+        def check_foo(self, data, **kwargs):
+            if data.get("foo", 0) < 0:
+                raise ValidationError("foo should not be negative")
+
+
 class ParamChildWithNull(object):
     @story
     @arguments("foo", "bar")
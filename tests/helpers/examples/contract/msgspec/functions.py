@@ -0,0 +1,3 @@
+# -*- coding: utf-8 -*-
+from examples.contract.common.functions import *  # noqa: F401, F403
+from examples.contract.msgspec import *  # noqa: F401, F403
@@ -78,6 +78,21 @@ class ParamChild(object):
         baz: int
 
 
+class ParamChildShallow(object):
+    @story
+    @arguments("foo", "bar")
+    def x(I):
+        I.one
+
+    @x.contract
+    class Contract(BaseModel):
+        foo: int
+        bar: List[int]
+        baz: int
+
+    x.shallow("bar")
+
+
 class ParamChildWithNull(object):
     @story
     @arguments("foo", "bar")
@@ -117,6 +117,17 @@ class ParamChild(object):
     x.contract({"foo": integer, "bar": list_of(integer), "baz": integer})
 
 
+class ParamChildShallow(object):
+    @story
+    @arguments("foo", "bar")
+    def x(I):
+        I.one
+
+    x.contract({"foo": integer, "bar": list_of(integer), "baz": integer})
+
+    x.shallow("bar")
+
+
 class ParamChildWithNull(object):
     @story
     @arguments("foo", "bar")
@@ -17,8 +17,10 @@ def make_collector():
 
     storage = []
 
-    def wrapper(contract, kwargs, history):
-        ctx, ns, lines, set_method = origin_make_context(contract, kwargs, history)
+    def wrapper(contract, kwargs, history, validation):
+        ctx, ns, lines, set_method = origin_make_context(
+            contract, kwargs, history, validation
+        )
         storage.append(ctx)
         return ctx, ns, lines, set_method
 
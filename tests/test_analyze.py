@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+import _stories.contract
+import _stories.failures
+from stories.analyze import analyze
+from stories.analyze import main
+from stories.analyze import trust
+from stories.exceptions import ContextContractError
+from stories.exceptions import FailureProtocolError
+
+
+def test_analyze_proven(r):
+    """Story is proven if its steps assign variables known to the contract
+    once."""
+
+    f = r.import_module("examples.analyze")
+
+    assert repr(analyze(f.Safe().x)) == "Safe.x: proven"
+
+    # Substory DI.
+
+    assert repr(analyze(f.Composed().a)) == "Composed.a: proven"
+
+
+def test_analyze_errors(r):
+    """Story is not proven if its steps could assign unknown variable,
+    override existing one, or use context in the way we could not
+    analyze."""
+
+    f = r.import_module("examples.analyze")
+
+    expected = """
+Unknown.x: not proven
+  error: Unknown.two assigns variable 'spam' unknown to the contract
+    """.strip()
+
+    assert repr(analyze(f.Unknown().x)) == expected
+
+    expected = """
+Override.x: not proven
+  error: Override.two assigns variable 'bar' set by Override.one
+  error: Override.two assigns variable 'foo' set by story argument
+    """.strip()
+
+    assert repr(analyze(f.Override().x)) == expected
+
+    expected = """
+Loop.x: not proven
+  error: Loop.two could assign variable 'baz' many times
+    """.strip()
+
+    assert repr(analyze(f.Loop().x)) == expected
+
+    expected = """
+Escape.x: not proven
+  error: Escape.two uses context in the way which could not be analyzed
+    """.strip()
+
+    assert repr(analyze(f.Escape().x)) == expected
+
+    expected = """
+Decorated.x: not proven
+  error: Decorated.two is decorated and could not be analyzed
+    """.strip()
+
+    assert repr(analyze(f.Decorated().x)) == expected
+
+    expected = """
+Dunder.x: not proven
+  error: Dunder.two uses context in the way which could not be analyzed
+    """.strip()
+
+    assert repr(analyze(f.Dunder().x)) == expected
+
+    expected = """
+NoSource.x: not proven
+  error: NoSource.two source code could not be analyzed
+    """.strip()
+
+    assert repr(analyze(f.NoSource().x)) == expected
+
+
+def test_analyze_warnings(r):
+    """Variables read before they are assigned do not prevent the story from
+    being proven."""
+
+    f = r.import_module("examples.analyze")
+
+    expected = """
+Read.x: proven
+  warning: Read.one reads variable 'baz' before it is assigned
+    """.strip()
+
+    assert repr(analyze(f.Read().x)) == expected
+
+
+def test_trust(r, monkeypatch):
+    """Proven story skips checks of assigned names.
+
+    Every instance with the same steps is trusted once the story was
+    proven.
+    """
+
+    f = r.import_module("examples.analyze")
+
+    class T(f.Child, f.SafeMethod):
+        pass
+
+    class E(f.Child, f.UnknownMethod):
+        pass
+
+    class J(f.Injected):
+        pass
+
+    class Q(f.Parent, f.ParentMethod):
+        def __init__(self):
+            self.x = T().x
+
+    def check_assign_name(*args):
+        raise AssertionError  # pragma: no cover
+
+    assert T().x.trusted is None
+    assert not trust(T().x).errors
+    assert T().x.trusted == frozenset()
+
+    monkeypatch.setattr(
+        _stories.contract.SpecContract, "check_assign_name", check_assign_name
+    )
+    assert r(T().x.run)(foo=1).is_success
+    monkeypatch.undo()
+
+    assert trust(E().x).errors
+    assert E().x.trusted is None
+    with pytest.raises(ContextContractError):
+        r(E().x)(foo=1)
+
+    assert trust(f.Decorated().x).errors
+    with pytest.raises(ContextContractError):
+        r(f.Decorated().x)(foo=1)
+
+    assert not trust(J(f.Safe().two).x).errors
+    assert J(f.Safe().two).x.trusted is not None
+    assert J(f.Unknown().two).x.trusted is None
+
+    # Substory DI.
+
+    assert not trust(Q().a).errors
+    assert Q().a.trusted == frozenset(["foo"])
+    assert r(Q().a.run)(ham=1).is_success
+    with pytest.raises(ContextContractError):
+        r(Q().a)(ham=1, foo=1)
+
+
+def test_analyze_failure_reasons(r):
+    """Failure reasons returned by steps are checked against the failure
+    protocol of the story composition."""
+
+    f = r.import_module("examples.analyze")
+
+    assert repr(analyze(f.ListFailure().x)) == "ListFailure.x: proven"
+
+    assert repr(analyze(f.EnumFailure().x)) == "EnumFailure.x: proven"
+
+    expected = """
+WrongFailure.x: not proven
+  error: WrongFailure.two returns Failure('spam') not allowed by the failure protocol
+    """.strip()  # noqa: E501
+
+    assert repr(analyze(f.WrongFailure().x)) == expected
+
+    expected = """
+NullFailure.x: not proven
+  error: NullFailure.two returns Failure() not allowed by the failure protocol
+    """.strip()
+
+    assert repr(analyze(f.NullFailure().x)) == expected
+
+    # Substory without failure protocol.
+
+    assert repr(analyze(f.DisabledFailure().x)) == "DisabledFailure.x: proven"
+
+    expected = """
+ComposedFailure.a: not proven
+  error: DisabledFailure.two returns Failure() not allowed by the failure protocol
+  warning: ComposedFailure.after reads variable 'baz' before it is assigned
+    """.strip()  # noqa: E501
+
+    assert repr(analyze(f.ComposedFailure().a)) == expected
+
+
+def test_trust_failure_reasons(r, monkeypatch):
+    """Failure reasons of proven steps are not checked.
+
+    Reason is proven if it is given as the only positional or keyword
+    argument.  Steps returning values we could not analyze are checked
+    as usual.
+    """
+
+    f = r.import_module("examples.analyze")
+
+    def check_return_statement(*args):
+        raise AssertionError
+
+    assert analyze(f.ListFailure().x).checked == {1, 2}
+    assert analyze(f.KeywordFailure().x).checked == {1, 2}
+    assert analyze(f.IndirectFailure().x).checked == {1}
+    assert analyze(f.StarredFailure().x).checked == {1}
+    assert analyze(f.ExtraFailure().x).checked == {1}
+    assert analyze(f.ItemFailure().x).checked == {1}
+
+    assert not trust(f.ListFailure().x).errors
+    assert not trust(f.KeywordFailure().x).errors
+    assert not trust(f.IndirectFailure().x).errors
+    assert not trust(f.StarredFailure().x).errors
+
+    monkeypatch.setattr(
+        _stories.failures.NotNullExecProtocol,
+        "check_return_statement",
+        check_return_statement,
+    )
+
+    result = r(f.ListFailure().x.run)(foo=1)
+    assert result.failed_because("foo")
+
+    result = r(f.KeywordFailure().x.run)(foo=1)
+    assert result.failed_because(f.ChildWithEnum.Errors.foo)
+
+    with pytest.raises(AssertionError):
+        r(f.IndirectFailure().x.run)(foo=1)
+
+    with pytest.raises(AssertionError):
+        r(f.StarredFailure().x.run)(foo=1)
+
+    monkeypatch.undo()
+
+    # Wrapper of the decorated step could return another reason.
+
+    assert analyze(f.WrappedFailure().x).checked == {1}
+    assert trust(f.WrappedFailure().x).errors
+    with pytest.raises(FailureProtocolError):
+        r(f.WrappedFailure().x.run)(foo=2)
+
+
+def test_command_line(capsys):
+    """Stories of classes instantiated without arguments are analyzed from
+    the command line."""
+
+    assert main(["examples.analyze.functions:Safe"]) == 0
+    assert capsys.readouterr().out == "Safe.x: proven\n"
+
+    assert main(["examples.analyze.functions"]) == 1
+    out = capsys.readouterr().out
+    assert "Composed.a: proven\n" in out
+    assert "Injected.x: skipped, " in out
+    assert "Unknown.x: not proven\n" in out
+
+    assert main([]) == 2
+    expected = "Usage: python -m stories.analyze module[:Class] ...\n"
+    assert capsys.readouterr().err == expected
@@ -3,11 +3,17 @@ import decimal
 
 import pytest
 
+import _stories.settings
 from helpers import make_collector
+from stories import arguments
+from stories import story
 from stories.exceptions import ContextContractError
 from stories.exceptions import FailureError
 from stories.exceptions import FailureProtocolError
 from stories.exceptions import MutationError
+from stories.exceptions import StoryDefinitionError
+from stories.settings import configure
+from stories.settings import sampled
 
 
 def test_context_private_fields(r, c):
@@ -66,6 +72,18 @@ def test_context_dir(r, c):
     assert r(J().a.run)(bar=1).value == dir(Ctx())
 
 
+def test_context_type(r, c):
+    """Every story call uses the same context class."""
+
+    class T(c.Child, c.TypeMethod):
+        pass
+
+    class Q(c.ParamChild, c.TypeMethod):
+        pass
+
+    assert r(T().x)() is r(T().x)() is r(Q().x)(bar=1)
+
+
 def test_deny_context_attribute_deletion(r, c):
     """We can't use attribute deletion with `Context` object."""
 
@@ -398,6 +416,175 @@ Context:
     assert repr(getter()) == expected
 
 
+def test_context_representation_with_lazy_result(r, x):
+    """Returned value is represented only when the context is shown."""
+
+    class Value(object):
+        calls = 0
+
+        def __repr__(self):
+            Value.calls += 1
+            return "Value()"
+
+    expected = """
+ImplementationDI.x
+  one (returned: Value())
+
+Context:
+  foo: 1  # Story argument
+    """.strip()
+
+    getter = make_collector()
+    r(x.ImplementationDI(f=lambda arg: Value()).x)(foo=1)
+    assert Value.calls == 0
+    assert repr(getter()) == expected
+    assert Value.calls == 1
+
+
+def test_context_representation_without_history(r, x, monkeypatch):
+    """History and provenance are not recorded when history is off."""
+
+    monkeypatch.setitem(_stories.settings.settings, "history", "full")
+    configure(history="off")
+
+    expected = """
+Simple.x (history is not recorded)
+
+Context:
+  bar: 3
+  foo: 1
+  baz: 4
+    """.strip()
+
+    getter = make_collector()
+    assert r(x.Simple().x)(foo=1, bar=3) == -1
+    assert repr(getter()) == expected
+
+    getter = make_collector()
+    assert r(x.Simple().x.run)(foo=1, bar=3).value == -1
+    assert repr(getter()) == expected
+
+    expected = """
+SubstoryDI.y (history is not recorded)
+
+Context:
+  spam: -2
+  foo: -3
+  bar: -1
+    """.strip()
+
+    getter = make_collector()
+    assert r(x.SubstoryDI(x.Simple().x).y)(spam=-2) == -4
+    assert repr(getter()) == expected
+
+    expected = """
+StepError.x (history is not recorded)
+
+Context()
+    """.strip()
+
+    getter = make_collector()
+    with pytest.raises(x.ExpectedException):
+        r(x.StepError().x)()
+    assert repr(getter()) == expected
+
+    getter = make_collector()
+    with pytest.raises(FailureError):
+        r(x.Simple().x)(foo=2, bar=3)
+    assert r(x.Simple().x.run)(foo=2, bar=3).failed_on("two")
+
+
+def test_context_representation_with_history_level(r, x, monkeypatch):
+    """History level of the story takes precedence over the global one."""
+
+    monkeypatch.setitem(_stories.settings.settings, "history", "full")
+    configure(history=sampled(1))
+
+    class T(x.Simple):
+        @story
+        @arguments("foo", "bar")
+        def x(I):
+            I.one
+            I.two
+            I.three
+
+    T.x.history(sampled(0))
+
+    expected = """
+T.x (history is not recorded)
+
+Context:
+  bar: 3
+  foo: 1
+  baz: 4
+    """.strip()
+
+    getter = make_collector()
+    r(T().x)(foo=1, bar=3)
+    assert repr(getter()) == expected
+
+    expected = """
+Simple.x
+  one
+  two
+  three (returned: -1)
+
+Context:
+  bar: 3  # Story argument
+  foo: 1  # Story argument
+  baz: 4  # Set by Simple.two
+    """.strip()
+
+    getter = make_collector()
+    r(x.Simple().x)(foo=1, bar=3)
+    assert repr(getter()) == expected
+
+    T.x.history("full")
+    configure(history="off")
+
+    expected = """
+T.x
+  one
+  two
+  three (returned: -1)
+
+Context:
+  bar: 3  # Story argument
+  foo: 1  # Story argument
+  baz: 4  # Set by T.two
+    """.strip()
+
+    getter = make_collector()
+    r(T().x)(foo=1, bar=3)
+    assert repr(getter()) == expected
+
+
+def test_deny_unknown_history_level(x):
+    """History level should be one of the known levels."""
+
+    expected = """
+Unexpected history level: 'partial'
+
+Available levels are: 'full', 'off', sampled(rate)
+    """.strip()
+
+    with pytest.raises(StoryDefinitionError) as exc_info:
+        configure(history="partial")
+    assert str(exc_info.value) == expected
+
+    with pytest.raises(StoryDefinitionError) as exc_info:
+        x.Simple.x.history("partial")
+    assert str(exc_info.value) == expected
+
+    expected = """
+Sampling rate should be a number between 0 and 1: 2
+    """.strip()
+
+    with pytest.raises(StoryDefinitionError) as exc_info:
+        sampled(2)
+    assert str(exc_info.value) == expected
+
+
 def test_context_representation_with_skip(r, x):
 
     expected = """
@@ -1,8 +1,27 @@
 # -*- coding: utf-8 -*-
+import pickle
+import sys
+from collections import OrderedDict
+
 import pytest
 
+import _stories.memo
+import _stories.settings
 from helpers import make_collector
+from stories import arguments
+from stories import story
 from stories.exceptions import ContextContractError
+from stories.exceptions import StoryDefinitionError
+from stories.settings import configure
+from stories.settings import memo_counters
+from stories.settings import sampled
+from stories.settings import validation_counters
+
+
+def skip_without_normalization(m):
+    # Annotated contracts check types without converting values.
+    if not getattr(m, "normalization", True):
+        pytest.skip("Contract does not normalize values")
 
 
 # TODO: Show collected arguments of the story composition in the error
@@ -79,6 +98,30 @@ Context:
     assert str(exc_info.value) == expected
 
 
+def test_contract_variables(r, m):
+    """Known variables of the contract are computed once the story is
+    composed."""
+
+    class T(m.ParamChild, m.NormalMethod):
+        pass
+
+    class J(m.ParamParent, m.NormalParentMethod):
+        def __init__(self):
+            self.x = T().x
+
+    # Simple.
+
+    contract = T().x.contract
+    assert contract.ordered_argset == ("bar", "foo")
+    assert contract.variables == {"foo", "bar", "baz"}
+
+    # Substory DI.
+
+    contract = J().a.contract
+    assert contract.ordered_argset == ("bar", "eggs", "foo", "ham")
+    assert contract.variables == {"foo", "bar", "ham", "eggs", "beans"}
+
+
 def test_context_variables_normalization(r, m):
     """We apply normalization to the context variables, if story defines
     context contract.
@@ -87,6 +130,8 @@ def test_context_variables_normalization(r, m):
     number in the context.
     """
 
+    skip_without_normalization(m)
+
     class T(m.Child, m.StringMethod):
         pass
 
@@ -126,6 +171,8 @@ def test_context_variables_normalization_conflict(r, m):
     result.
     """
 
+    skip_without_normalization(m)
+
     # FIXME: Normalization conflict can consist of two
     # variables.  The first variable can be set by one
     # substory.  The second variable can be set by
@@ -178,6 +225,8 @@ def test_story_arguments_normalization(r, m):
     should store a number in the context.
     """
 
+    skip_without_normalization(m)
+
     class T(m.ParamChild, m.NormalMethod):
         pass
 
@@ -214,6 +263,8 @@ def test_story_arguments_normalization_many_levels(r, m):
     """We apply normalization to the story arguments on any levels of story
     composition."""
 
+    skip_without_normalization(m)
+
     class T(m.ParamChild, m.NormalMethod):
         pass
 
@@ -258,6 +309,135 @@ def test_story_arguments_normalization_many_levels(r, m):
     assert getter().bar == [4]
 
 
+def test_story_arguments_distinct_validators(r):
+    """Equivalent validators of the story argument are applied once.
+
+    Substories sharing the validator of the argument are still shown in
+    the contract representation.
+    """
+
+    m = r.import_module("examples.contract.raw")
+
+    calls = []
+
+    def integer(value):
+        calls.append(value)
+        return m.integer(value)
+
+    class T(m.NormalMethod):
+        @story
+        @arguments("foo")
+        def x(I):
+            I.one
+
+        x.contract({"foo": integer})
+
+    class Q(m.NormalMethod):
+        @story
+        @arguments("foo")
+        def y(I):
+            I.one
+
+        y.contract({"foo": integer})
+
+    class J(m.NormalParentMethod):
+        @story
+        @arguments("foo")
+        def a(I):
+            I.before
+            I.x
+            I.y
+            I.after
+
+        a.contract({"foo": integer})
+
+        def __init__(self):
+            self.x = T().x
+            self.y = Q().y
+
+    getter = make_collector()
+    r(J().a)(foo="1")
+    assert getter().foo == 1
+    assert calls == ["1"]
+
+    expected = """
+Contract:
+  foo:
+    integer  # Argument of J.a
+    integer  # Argument of Q.y
+    integer  # Argument of T.x
+    """.strip()
+
+    assert repr(J().a.contract) == expected
+
+
+def test_story_arguments_memo(r, monkeypatch):
+    """Validation results of immutable story arguments are cached.
+
+    Aliases of the cached argument hold the same object.  Mutable
+    arguments are validated on every call.
+    """
+
+    m = r.import_module("examples.contract.raw")
+
+    calls = []
+
+    def integers(value):
+        calls.append(value)
+        if isinstance(value, (list, tuple)):
+            new_values = [m.integer(element) for element in value]
+            if not any(error for _new_value, error in new_values):
+                return type(value)(new for new, _error in new_values), None
+        return None, "Invalid value"
+
+    class T(m.NormalMethod):
+        @story
+        @arguments("foo", "bar")
+        def x(I):
+            I.one
+
+        x.contract({"foo": integers, "bar": integers})
+
+    monkeypatch.setattr(_stories.memo, "cache", OrderedDict())
+    monkeypatch.setitem(_stories.settings.settings, "memo", 0)
+    configure(memo=2)
+
+    before = memo_counters()
+
+    value = ("1", "2")
+    for _call in range(2):
+        getter = make_collector()
+        r(T().x)(foo=value, bar=value)
+        assert getter().foo == (1, 2)
+        assert getter().foo is getter().bar
+    assert calls == [value]
+
+    for _call in range(2):
+        with pytest.raises(ContextContractError):
+            r(T().x)(foo=("x",), bar=value)
+    assert calls == [value, ("x",)]
+
+    mutable = ["1", "2"]
+    for _call in range(2):
+        getter = make_collector()
+        r(T().x)(foo=mutable, bar=mutable)
+        assert getter().foo == [1, 2]
+    assert calls == [value, ("x",)] + [mutable] * 4
+
+    after = memo_counters()
+    assert after["hits"] - before["hits"] == 6
+    assert after["misses"] - before["misses"] == 2
+
+    configure(memo=1)
+    r(T().x)(foo=("3",), bar=("3",))
+    assert len(_stories.memo.cache) == 1
+
+    with pytest.raises(StoryDefinitionError) as exc_info:
+        configure(memo=-1)
+    expected = "Memo cache size should be a non-negative integer: -1"
+    assert str(exc_info.value) == expected
+
+
 def test_story_arguments_normalization_conflict(r, m):
     """Story and substory can have an argument with the same name.
 
@@ -266,6 +446,8 @@ def test_story_arguments_normalization_conflict(r, m):
     an error.
     """
 
+    skip_without_normalization(m)
+
     class T(m.ParamChild, m.NormalMethod):
         pass
 
@@ -376,6 +558,48 @@ Contract:
     assert str(exc_info.value) == expected
 
 
+def test_validation_error_message_is_lazy(r, m):
+    """Validation error carries the message template and its fields.
+
+    The message is rendered on the first read.  Contract representation
+    is built once.
+    """
+
+    class T(m.ParamChild, m.NormalMethod):
+        pass
+
+    with pytest.raises(ContextContractError) as exc_info:
+        r(T().x)(foo="<boom>", bar=[1])
+
+    (message,) = exc_info.value.args
+    assert message.text is None
+    assert message.fields["variables"] == "'foo'"
+    assert message.fields["method"] == "x"
+
+    assert str(exc_info.value).startswith(
+        "These arguments violates context contract: 'foo'"
+    )
+    assert message.text is str(exc_info.value)
+    assert repr(exc_info.value) == "ContextContractError(%r)" % str(exc_info.value)
+
+    contract = T().x.contract
+    assert repr(contract) is repr(contract)
+
+
+def test_validation_error_pickle(r, m):
+    """Pickled validation error carries the rendered message."""
+
+    class T(m.ParamChild, m.NormalMethod):
+        pass
+
+    for kwargs in [{"foo": 1, "bar": [2], "spam": 3}, {"foo": "<boom>", "bar": [1]}]:
+        with pytest.raises(ContextContractError) as exc_info:
+            r(T().x)(**kwargs)
+        error = pickle.loads(pickle.dumps(exc_info.value))
+        assert type(error) is ContextContractError
+        assert error.args == (str(exc_info.value),)
+
+
 def test_story_arguments_validation(r, m):
     """We apply validators to the story arguments, if story defines context
     contract.
@@ -462,6 +686,49 @@ Contract:
     assert str(exc_info.value) == expected
 
 
+def test_story_arguments_schema_validation(r, m):
+    """Errors of the schema validator are not bound to a field.
+
+    Each story argument validated by the schema violates the contract.
+    """
+
+    if not hasattr(m, "ParamChildWithSchemaCheck"):
+        pytest.skip("Contract does not have schema validators")
+
+    class T(m.ParamChildWithSchemaCheck, m.NormalMethod):
+        pass
+
+    assert r(T().x.run)(foo=1, bar=[2]).is_success
+
+    expected = """
+These arguments violates context contract: 'bar', 'foo'
+
+Story method: T.x
+
+Violations:
+
+bar:
+  [2]
+  foo should not be negative
+
+foo:
+  -1
+  foo should not be negative
+
+Contract:
+  bar: List  # Argument of T.x
+  foo: Integer  # Argument of T.x
+    """.strip()
+
+    with pytest.raises(ContextContractError) as exc_info:
+        r(T().x)(foo=-1, bar=[2])
+    assert str(exc_info.value) == expected
+
+    with pytest.raises(ContextContractError) as exc_info:
+        r(T().x.run)(foo=-1, bar=[2])
+    assert str(exc_info.value) == expected
+
+
 def test_story_arguments_validation_many_levels(r, m):
     """We apply contract validation to the story arguments on any levels of
     story composition."""
@@ -982,6 +1249,8 @@ def test_parent_steps_set_story_arguments(r, m):
     """Steps of parent stories should be able to set child stories arguments
     with `Success` marker keyword arguments."""
 
+    skip_without_normalization(m)
+
     class T(m.ParamChild, m.NormalMethod):
         pass
 
@@ -1105,6 +1374,8 @@ def test_story_variable_alias_normalization_store_same_object(r, m):
     should preserve the same reference to the value.
     """
 
+    skip_without_normalization(m)
+
     class T(m.ChildAlias, m.AliasMethod):
         pass
 
@@ -1139,6 +1410,8 @@ def test_story_argument_alias_normalization_store_same_object(r, m):
     should preserve the same reference to the value.
     """
 
+    skip_without_normalization(m)
+
     class T(m.ParamChildAlias, m.NormalMethod):
         pass
 
@@ -1167,6 +1440,41 @@ def test_story_argument_alias_normalization_store_same_object(r, m):
     # FIXME: Substory DI.
 
 
+def test_shallow_fields_store_same_object(r, m):
+    """Shallow fields of the contract are checked by the type of the value.
+
+    Elements of containers are not validated and the original object is
+    stored in the context.
+    """
+
+    skip_without_normalization(m)
+
+    class T(m.ParamChildShallow, m.NormalMethod):
+        pass
+
+    class J(m.ParamParent, m.NormalParentMethod):
+        def __init__(self):
+            self.x = T().x
+
+    # Simple.
+
+    bar = ["1", "2"]
+    getter = make_collector()
+    r(T().x)(foo="1", bar=bar)
+    assert getter().foo == 1
+    assert getter().bar is bar
+
+    with pytest.raises(ContextContractError):
+        r(T().x)(foo=1, bar=1)
+
+    # Substory DI.
+
+    bar = ["1", "2"]
+    getter = make_collector()
+    r(J().a.run)(foo=1, bar=bar, eggs=2, ham=3)
+    assert getter().bar is bar
+
+
 # Representation.
 
 
@@ -1347,3 +1655,487 @@ Contract:
     #     """.strip()
     #
     #     assert repr(F().i.contract) == expected
+
+
+def test_validation_levels(r, m, monkeypatch):
+    """Validation level defines which values are checked by the contract.
+
+    Values which were not checked are stored as is.  Unknown arguments,
+    unknown variables and variable override are denied on each level.
+    """
+
+    skip_without_normalization(m)
+
+    monkeypatch.setitem(_stories.settings.settings, "validation", "full")
+
+    class T(m.Child, m.StringMethod):
+        pass
+
+    class Q(m.ParamChild, m.NormalMethod):
+        pass
+
+    class U(m.Child, m.UnknownMethod):
+        pass
+
+    class V(m.ParamChild, m.StringMethod):
+        pass
+
+    # Full.
+
+    getter = make_collector()
+    r(T().x)()
+    assert getter().foo == 1
+
+    getter = make_collector()
+    r(Q().x)(foo="1", bar=["2"])
+    assert getter().foo == 1
+
+    # Arguments.
+
+    configure(validation="arguments")
+
+    getter = make_collector()
+    r(T().x)()
+    assert getter().foo == "1"
+
+    getter = make_collector()
+    r(Q().x)(foo="1", bar=["2"])
+    assert getter().foo == 1
+
+    with pytest.raises(ContextContractError):
+        r(Q().x)(foo="<boom>", bar=["<boom>"])
+
+    # Off.
+
+    configure(validation="off")
+
+    getter = make_collector()
+    r(Q().x)(foo="<boom>", bar=["<boom>"])
+    assert getter().foo == "<boom>"
+
+    for level in ["arguments", "off"]:
+        configure(validation=level)
+
+        with pytest.raises(ContextContractError) as exc_info:
+            r(Q().x)(foo=1, bar=[2], spam=3)
+        assert str(exc_info.value).startswith("These arguments are unknown: spam")
+
+        with pytest.raises(ContextContractError) as exc_info:
+            r(U().x)()
+        assert str(exc_info.value).startswith(
+            "This variable was not defined in the context contract: 'spam'"
+        )
+
+        with pytest.raises(ContextContractError) as exc_info:
+            r(V().x)(foo=1, bar=[2])
+        assert str(exc_info.value).startswith(
+            "This variable is already present in the context: 'foo'"
+        )
+
+
+annotations = pytest.mark.skipif(
+    sys.version_info < (3, 8), reason="TypedDict is not supported"
+)
+
+
+@annotations
+def test_annotated_contract_representation(r):
+    """Class with annotations is a contract.
+
+    Each annotation is shown as a field representation.
+    """
+
+    a = r.import_module("examples.contract.annotations")
+
+    class T(a.AnnotatedChild, a.AnnotatedMethod):
+        pass
+
+    expected = """
+Contract:
+  bar: List[str]  # Argument of T.x
+  foo: int  # Argument of T.x
+  baz: Optional[Dict[str, float]]  # Variable in T.x
+  point: Point  # Variable in T.x
+    """.strip()
+
+    assert repr(T().x.contract) == expected
+
+
+@annotations
+def test_annotated_contract_validation(r):
+    """Annotated contract checks types of values without converting them.
+
+    Valid value is stored in the context as is.
+    """
+
+    a = r.import_module("examples.contract.annotations")
+
+    class T(a.AnnotatedChild, a.AnnotatedMethod):
+        pass
+
+    bar = ["a", "b"]
+    t = T()
+    assert r(t.x.run)(foo=1, bar=bar).is_success
+    assert t.bar is bar
+
+    with pytest.raises(ContextContractError) as exc_info:
+        r(T().x)(foo="1", bar=["a", 2])
+    message = str(exc_info.value)
+    assert "Expected int, got str" in message
+    assert "Expected str, got int at [1]" in message
+
+    class T(a.AnnotatedChild, a.AnnotatedMethod):
+        baz = {"a": "1"}
+
+    with pytest.raises(ContextContractError) as exc_info:
+        r(T().x)(foo=1, bar=[])
+    assert "Expected float, got str at ['a']" in str(exc_info.value)
+
+    class T(a.AnnotatedChild, a.AnnotatedMethod):
+        point = {"x": 1}
+
+    with pytest.raises(ContextContractError) as exc_info:
+        r(T().x)(foo=1, bar=[])
+    assert "Expected float, got nothing at ['y']" in str(exc_info.value)
+
+
+@annotations
+def test_annotated_contract_containers(r, monkeypatch):
+    """Elements of containers are checked according to the level."""
+
+    a = r.import_module("examples.contract.annotations")
+
+    class T(a.AnnotatedChild, a.AnnotatedMethod):
+        pass
+
+    monkeypatch.setitem(_stories.settings.settings, "containers", "full")
+
+    bar = ["a"] * 9 + [1]
+
+    configure(containers="shallow")
+    assert r(T().x.run)(foo=1, bar=bar).is_success
+    with pytest.raises(ContextContractError):
+        r(T().x)(foo=1, bar="a")
+
+    configure(containers=sampled(0.5))
+    assert r(T().x.run)(foo=1, bar=bar).is_success
+    with pytest.raises(ContextContractError):
+        r(T().x)(foo=1, bar=list(reversed(bar)))
+
+    configure(containers="full")
+    with pytest.raises(ContextContractError):
+        r(T().x)(foo=1, bar=bar)
+
+    with pytest.raises(StoryDefinitionError):
+        configure(containers="deep")
+
+
+@annotations
+def test_annotated_contract_annotations(r):
+    """Literals, fixed tuples, nested unions and `Any` are checked.
+
+    Elements of iterators are not checked.  The check would exhaust
+    them before the step.
+    """
+
+    a = r.import_module("examples.contract.annotations")
+
+    class T(a.VariousChild, a.VariousMethod):
+        pass
+
+    kwargs = {
+        "rows": [1, 2],
+        "mode": "fast",
+        "pair": (1, "a"),
+        "value": ["a", 1],
+        "anything": object(),
+    }
+
+    assert r(T().x)(**kwargs) == [1, 2]
+    assert r(T().x)(**dict(kwargs, value=1)) == [1, 2]
+    assert r(T().x)(**dict(kwargs, rows=(i for i in range(3)))) == [0, 1, 2]
+
+    for name, value, expected in [
+        ("rows", [1, "a"], "Expected int, got str at [1]"),
+        ("rows", 1, "Expected Iterable[int], got int"),
+        ("mode", "medium", "Expected Literal['fast', 'slow'], got 'medium'"),
+        ("pair", (1, 2), "Expected str, got int at [1]"),
+        ("pair", (1,), "Expected Tuple[int, str], got tuple"),
+        ("value", ["a", 1.5], "Expected Union[str, int], got float at [1]"),
+        ("value", "a", "Expected Union[int, List[Union[str, int]]], got str"),
+    ]:
+        with pytest.raises(ContextContractError) as exc_info:
+            r(T().x)(**dict(kwargs, **{name: value}))
+        assert expected in str(exc_info.value)
+
+
+@annotations
+def test_annotated_contract_structures(r):
+    """Keys and values of mappings and fields of typed dicts are checked.
+
+    Optional fields of typed dict could be missed.  Float accepts
+    integers and complex accepts floats.
+    """
+
+    a = r.import_module("examples.contract.annotations")
+
+    class T(a.StructureChild, a.StructureMethod):
+        pass
+
+    segment = {"start": {"x": 1, "y": 2.0}}
+    kwargs = {
+        "scores": {"a": 1},
+        "segment": segment,
+        "ratio": 1,
+        "number": 1.5,
+        "empty": (),
+    }
+
+    assert r(T().x)(**kwargs) is segment
+    assert r(T().x)(**dict(kwargs, segment={})) == {}
+
+    for name, value, expected in [
+        ("scores", [1], "Expected Dict[str, int], got list"),
+        ("scores", {1: 1}, "Expected str, got int"),
+        ("scores", {"a": "1"}, "Expected int, got str at ['a']"),
+        ("segment", [1], "Expected Segment, got list"),
+        (
+            "segment",
+            {"start": {"x": 1, "y": "2"}},
+            "Expected float, got str at ['start']['y']",
+        ),
+        ("segment", {"label": 1}, "Expected str, got int at ['label']"),
+        ("ratio", "1", "Expected float, got str"),
+        ("number", "1", "Expected complex, got str"),
+        ("empty", (1,), "Expected Tuple[()], got tuple"),
+    ]:
+        with pytest.raises(ContextContractError) as exc_info:
+            r(T().x)(**dict(kwargs, **{name: value}))
+        assert expected in str(exc_info.value)
+
+
+@annotations
+def test_annotated_contract_shallow_fields(r):
+    """Shallow fields of annotated contract are checked by their shape.
+
+    Elements of containers are not checked.  Type variables and `Any`
+    accept everything.
+    """
+
+    a = r.import_module("examples.contract.annotations")
+
+    class T(a.ShallowChild, a.ShallowMethod):
+        pass
+
+    value = ["a", 1]
+    kwargs = {
+        "value": value,
+        "mode": "fast",
+        "number": 1.5,
+        "item": object(),
+        "anything": None,
+    }
+
+    assert r(T().x)(**kwargs) is value
+    assert r(T().x)(**dict(kwargs, value=1)) == 1
+
+    for name, value, expected in [
+        ("value", "a", "Expected Union[int, List[str]], got str"),
+        ("mode", "medium", "Expected Literal['fast', 'slow'], got 'medium'"),
+        ("number", "1", "Expected complex, got str"),
+    ]:
+        with pytest.raises(ContextContractError) as exc_info:
+            r(T().x)(**dict(kwargs, **{name: value}))
+        assert expected in str(exc_info.value)
+
+
+@annotations
+def test_annotated_contract_class_variables(r):
+    """Class variables of the annotated contract are not context variables.
+
+    Step can not assign them to the context.
+    """
+
+    a = r.import_module("examples.contract.annotations")
+
+    class T(a.LimitedChild, a.LimitedMethod):
+        limit = "oops"
+
+    expected = """
+Contract:
+  foo: int  # Argument of T.x
+    """.strip()
+
+    assert repr(T().x.contract) == expected
+
+    with pytest.raises(ContextContractError) as exc_info:
+        r(T().x)(foo=1)
+    assert str(exc_info.value).startswith(
+        "This variable was not defined in the context contract: 'limit'"
+    )
+
+
+def test_unsupported_contract(r):
+    """Only plain annotated classes and supported models are contracts.
+
+    Model of the library version we do not support is not checked as an
+    annotated class.
+    """
+
+    c = r.import_module("examples.contract.common")
+
+    model = type(
+        "Model", (object,), {"__module__": "pydantic.main", "__annotations__": {}}
+    )
+
+    for spec in [model, ["foo"]]:
+
+        class T(c.NormalMethod):
+            @story
+            def x(I):
+                I.one
+
+            x.contract(spec)
+
+        expected = """
+This context contract is not supported: {!r}
+
+Story method: T.x
+
+Use a class with annotations, a typed dict, a dict of validators or a
+model of the supported contract library.
+        """.strip().format(spec)
+
+        with pytest.raises(ContextContractError) as exc_info:
+            T().x
+        assert str(exc_info.value) == expected
+
+
+@annotations
+def test_validation_level_of_story(r, monkeypatch):
+    """Validation level of the story takes precedence over the global one.
+
+    Story calls are counted for each level they were validated on.
+    """
+
+    a = r.import_module("examples.contract.annotations")
+
+    monkeypatch.setitem(_stories.settings.settings, "validation", "full")
+
+    class T(a.AnnotatedChild, a.AnnotatedMethod):
+        @story
+        @arguments("foo", "bar")
+        def x(I):
+            I.one
+
+        x.contract(a.AnnotatedChild.Contract)
+
+    before = validation_counters()
+
+    T.x.validation("off")
+    r(T().x)(foo="1", bar=[])
+
+    T.x.validation(sampled(0))
+    r(T().x)(foo=1, bar=[])
+    with pytest.raises(ContextContractError):
+        r(T().x)(foo="1", bar=[])
+
+    T.x.validation(sampled(1))
+    configure(validation="off")
+    r(T().x)(foo=1, bar=[])
+    with pytest.raises(ContextContractError):
+        r(T().x)(foo="1", bar=[])
+
+    after = validation_counters()
+    assert after["full"] - before["full"] == 2
+    assert after["arguments"] - before["arguments"] == 2
+    assert after["off"] - before["off"] == 1
+
+    expected = """
+Unexpected validation level: 'partial'
+
+Available levels are: 'full', 'arguments', 'off', sampled(rate)
+    """.strip()
+
+    with pytest.raises(StoryDefinitionError) as exc_info:
+        configure(validation="partial")
+    assert str(exc_info.value) == expected
+
+    with pytest.raises(StoryDefinitionError) as exc_info:
+        T.x.validation("partial")
+    assert str(exc_info.value) == expected
+
+
+@annotations
+def test_shallow_fields_definition(r):
+    """Shallow fields should be declared in the story contract."""
+
+    a = r.import_module("examples.contract.annotations")
+
+    with pytest.raises(StoryDefinitionError) as exc_info:
+
+        class T(a.AnnotatedChild, a.AnnotatedMethod):
+            @story
+            @arguments("foo", "bar")
+            def x(I):
+                I.one
+
+            x.contract(a.AnnotatedChild.Contract)
+            x.shallow()
+
+    assert str(exc_info.value) == "Story shallow fields can not be an empty list"
+
+    with pytest.raises(StoryDefinitionError) as exc_info:
+
+        class Q(a.AnnotatedChild, a.AnnotatedMethod):
+            @story
+            @arguments("foo", "bar")
+            def x(I):
+                I.one
+
+            x.contract(a.AnnotatedChild.Contract)
+            x.shallow("bar", 1)
+
+    expected = "Story shallow fields can only be defined with string type"
+    assert str(exc_info.value) == expected
+
+    class E(a.AnnotatedChild, a.AnnotatedMethod):
+        @story
+        @arguments("foo", "bar")
+        def x(I):
+            I.one
+
+        x.contract(a.AnnotatedChild.Contract)
+        x.shallow("bar", "spam")
+
+    expected = """
+These shallow fields should be declared in the context contract: spam
+
+Story method: E.x
+
+Shallow fields: bar, spam
+    """.strip()
+
+    with pytest.raises(ContextContractError) as exc_info:
+        r(E().x)(foo=1, bar=[])
+    assert str(exc_info.value) == expected
+
+    class J(a.AnnotatedChild, a.AnnotatedMethod):
+        @story
+        @arguments("foo", "bar")
+        def x(I):
+            I.one
+
+        x.contract(a.AnnotatedChild.Contract)
+        x.shallow("bar", "point")
+
+    bar = ["a"] * 9 + [1]
+    getter = make_collector()
+    r(J().x)(foo=1, bar=bar)
+    assert getter().bar is bar
+
+    with pytest.raises(ContextContractError) as exc_info:
+        r(J().x)(foo=1, bar=(1, 2))
+    assert str(exc_info.value).startswith(
+        "These arguments violates context contract: 'bar'"
+    )
@@ -1,7 +1,11 @@
 # -*- coding: utf-8 -*-
 import pytest
 
+import _stories.execute.generate
+
+from stories.exceptions import ContextContractError
 from stories.exceptions import FailureError
+from stories.exceptions import FailureProtocolError
 
 
 def test_signatures(r, x):
@@ -106,6 +110,20 @@ def test_failure_error_private_fields(r, x):
     assert exc_info.value.__dict__ == {}
 
 
+def test_failure_error_type(r, x):
+    """Every story call raises failure error of the same type."""
+
+    with pytest.raises(FailureError) as first:
+        r(x.Simple().x)(foo=2, bar=2)
+
+    with pytest.raises(FailureError) as second:
+        r(x.SubstoryDI(x.Simple().x).y)(spam=3)
+
+    assert type(first.value) is type(second.value)  # noqa: E721
+    assert type(first.value).__name__ == "FailureError"
+    assert str(first.value) == ""
+
+
 def test_result(r, x):
     """Result marker semantics."""
 
@@ -156,6 +174,106 @@ def test_skip(r, x):
     assert result.value == -4
 
 
+def test_skip_ends(x):
+    """Skip marker jumps to the end of the current substory."""
+
+    story = x.SubstoryDI(x.Pipe().y).y
+
+    assert story.plan.ends == (
+        13,  # SubstoryDI.y
+        13,  # start
+        13,  # before
+        11,  # x (Pipe.y)
+        11,  # before
+        9,  # x (Pipe.x)
+        9,  # one
+        9,  # two
+        9,  # three
+        None,
+        11,  # after
+        None,
+        13,  # after
+        None,
+    )
+
+
+def test_generated_executor(r, x):
+    """Story is executed by the function generated for its plan.
+
+    Deep compositions which could not be compiled this way are executed
+    by the generic executor loop.
+    """
+
+    class T(x.Child, x.NormalMethod):
+        pass
+
+    class J(x.Parent, x.NormalParentMethod):
+        def __init__(self, x):
+            self.x = x
+
+    story = x.SubstoryDI(x.Pipe().y).y
+    assert story.plan.execute is not story.plan.executor
+    assert r(story)(spam=-2) == -4
+
+    story = T().x
+    for _level in range(25):
+        story = J(story).a
+    assert story.plan.execute is story.plan.executor
+    assert r(story)() is None
+    assert r(story.run)().is_success
+
+
+def test_executor_loop(r, x, monkeypatch):
+    """Generic executor loop has the same semantics as generated executor."""
+
+    monkeypatch.setattr(_stories.execute.generate, "max_entries", 0)
+
+    class T(x.Simple):
+        pass
+
+    class J(x.SubstoryDI):
+        pass
+
+    class E(x.StepError):
+        pass
+
+    class N(x.Child, x.NormalMethod):
+        pass
+
+    assert T().x.plan.execute is T().x.plan.executor
+
+    with pytest.raises(FailureError):
+        r(T().x)(foo=2, bar=2)
+    assert r(T().x.run)(foo=2, bar=2).failed_on("two")
+    assert r(T().x)(foo=1, bar=3) == -1
+    assert r(T().x)(foo=1, bar=-1) is None
+    assert r(J(T().x).y)(spam=-2) == -4
+    assert r(N().x.run)().is_success
+
+    with pytest.raises(x.ExpectedException):
+        r(E().x)()
+
+    # Errors raised by the loop itself.
+
+    m = r.import_module("examples.contract.raw")
+    f = r.import_module("examples.failure_reasons")
+
+    class Q(m.ParamChildWithNull, m.NormalMethod):
+        pass
+
+    class W(f.ChildWithList, f.WrongMethod):
+        pass
+
+    with pytest.raises(ContextContractError):
+        r(Q().x)()
+
+    with pytest.raises(AssertionError):
+        r(x.WrongResult().x)()
+
+    with pytest.raises(FailureProtocolError):
+        r(W().x)()
+
+
 def test_return_type(r, x):
     """Story steps should return a marker.
 
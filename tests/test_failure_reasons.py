@@ -163,6 +163,23 @@ Function returned value: T.one
     assert str(exc_info.value) == expected
 
 
+def test_wrong_reason_message_is_lazy(r, f):
+    """Failure protocol error message is rendered on the first read."""
+
+    class T(f.ChildWithList, f.WrongMethod):
+        pass
+
+    with pytest.raises(FailureProtocolError) as exc_info:
+        r(T().x)()
+
+    (message,) = exc_info.value.args
+    assert message.text is None
+    assert message.fields["reason"] == "'foo' is too big"
+
+    assert str(exc_info.value).startswith('Failure("\'foo\' is too big")')
+    assert message.text is not None
+
+
 def test_wrong_reason_with_enum(r, f):
     """We deny to use wrong reason in stories defined with enum class as its
     failure protocol."""
@@ -652,6 +669,46 @@ def test_substory_protocol_match_with_enum(r, f):
     assert result.failed_because(J().a.failures.foo)
 
 
+def test_combined_protocol_interned(r, f):
+    """Equal failure protocols are combined once."""
+
+    class T(f.ChildWithList, f.StringMethod):
+        pass
+
+    class J(f.ParentWithList, f.NormalParentMethod):
+        def __init__(self):
+            self.x = T().x
+
+    class Q(f.ParentWithList, f.NormalParentMethod):
+        def __init__(self):
+            self.x = T().x
+
+    assert J().a.failures == ["foo", "bar", "baz"]
+    assert J().a.plan.run_protocol.index is Q().a.plan.run_protocol.index
+
+    # Each composition owns its list.
+
+    J().a.failures.append("quiz")
+    assert Q().a.failures == ["foo", "bar", "baz"]
+
+    class E(f.ChildWithEnum, f.EnumMethod):
+        pass
+
+    class J(f.ParentWithEnum, f.NormalParentMethod):
+        def __init__(self):
+            self.x = E().x
+
+    class Q(f.ParentWithEnum, f.NormalParentMethod):
+        def __init__(self):
+            self.x = E().x
+
+    assert J().a.failures is Q().a.failures
+
+    result = r(Q().a.run)()
+    assert result.failed_because(J().a.failures.foo)
+    assert result.failed_because(E().x.failures.foo)
+
+
 def test_expand_substory_protocol_null_with_list(r, f):
     """We expand protocol of composed story, if substory does not define
     failure protocols and parent story define protocol with list of strings."""
@@ -44,3 +44,20 @@ def test_success_summary_representation(r, x):
     expected = "Success()"
     result = r(x.Simple().x.run)(foo=1, bar=3)
     assert repr(result) == expected
+
+
+def test_summary_type(r, x):
+    """Every story run returns summary of the same type."""
+
+    failure = r(x.Simple().x.run)(foo=2, bar=2)
+    assert type(failure) is type(r(x.Simple().x.run)(foo=3, bar=2))  # noqa: E721
+    assert not hasattr(failure, "__dict__")
+    assert failure.is_failure
+    assert failure.failed_on("two")
+    assert failure.ctx.foo == 2
+
+    success = r(x.Simple().x.run)(foo=1, bar=3)
+    assert type(success) is type(r(x.Simple().x.run)(foo=1, bar=-1))  # noqa: E721
+    assert not hasattr(success, "__dict__")
+    assert success.is_success
+    assert success.value == -1
@@ -1,4 +1,8 @@
 # -*- coding: utf-8 -*-
+import copy
+import pickle
+import weakref
+
 import pytest
 
 from stories import story
@@ -57,6 +61,100 @@ SubstoryDI.y
     assert story == expected
 
 
+def test_story_mounting_cache(x):
+    """Mounted story is reused while instance attributes stay the same."""
+
+    class T(x.Child, x.NormalMethod):
+        pass
+
+    class J(x.Parent, x.NormalParentMethod):
+        def __init__(self):
+            self.x = T().x
+
+    t = T()
+    assert t.x is t.x
+    assert T().x is not t.x
+
+    # Bound methods of the instance are part of the cache key.
+
+    first = t.x
+    t.two = t.one
+    assert t.x is not first
+    assert repr(t.x) == "T.x\n  one\n  one\n  three"
+
+    # Substory mounted on its own is not affected by the composition.
+
+    j = J()
+    assert j.a is j.a
+    assert repr(j.x) == "T.x\n  one\n  two\n  three"
+
+
+def test_story_mounting_cache_instances(r, x):
+    """Mounted story cache does not hold the instance and does not mix
+    equal instances."""
+
+    class T(x.Child, x.NormalMethod):
+        def __eq__(self, other):
+            return True
+
+        __hash__ = None
+
+    t = T()
+    first = t.x
+    other = copy.copy(t)
+    assert other.x is not first
+    assert all(method.__self__ is other for method in other.x.callables)
+    assert all(method.__self__ is t for method in t.x.callables)
+
+    # Plan is reused after the mounted story is gone.
+
+    plan = first.plan
+    del first
+    assert t.x.plan is plan
+
+    # Instance is freed by reference counting.
+
+    ref = weakref.ref(t)
+    t.x
+    del t
+    assert ref() is None
+
+    # Cache is not stored in the instance.
+
+    simple = x.Simple()
+    simple.x
+    assert r(pickle.loads(pickle.dumps(simple)).x)(foo=1, bar=5) == 1
+
+
+def test_story_plan_shared_between_instances(x):
+    """Story compiled once per class is bound to the instance methods."""
+
+    class T(x.Child, x.NormalMethod):
+        pass
+
+    class J(x.Parent, x.NormalParentMethod):
+        def __init__(self):
+            self.x = T().x
+
+    first, second = T(), T()
+    assert first.x.plan is second.x.plan
+    assert first.x.methods[1][0] == first.one
+    assert second.x.methods[1][0] == second.one
+
+    assert J().a.plan is J().a.plan
+
+    # Failure protocol definition compiles story one more time.
+
+    plan = first.x.plan
+    T.x.failures(["foo"])
+    try:
+        assert T().x.plan is not plan
+        assert first.x.plan is not plan
+        assert first.x.failures == ["foo"]
+    finally:
+        T.x.failures(None)
+
+
 def test_story_class_attribute_representation(x):
 
     story = repr(x.Simple.x)